@@ -0,0 +1,59 @@
+"""tidy_oauth_indexes
+
+Revision ID: 0b6e4a93c7d8
+Revises: f58a2d9c3b14
+Create Date: 2026-10-15 13:05:12.084519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6e4a93c7d8'
+down_revision: Union[str, Sequence[str], None] = 'f58a2d9c3b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicates of the primary keys and of the per-column expiry indexes
+    op.drop_index(op.f('ix_oauth_clients_id'), table_name='oauth_clients')
+    op.drop_index(op.f('ix_oauth_authorization_codes_id'), table_name='oauth_authorization_codes')
+    op.drop_index('ix_auth_codes_expires_at', table_name='oauth_authorization_codes')
+    op.drop_index(op.f('ix_oauth_tokens_id'), table_name='oauth_tokens')
+    op.drop_index('ix_tokens_access_expires', table_name='oauth_tokens')
+    op.drop_index('ix_tokens_refresh_expires', table_name='oauth_tokens')
+
+    op.drop_index(op.f('ix_oauth_clients_client_id'), table_name='oauth_clients')
+    op.create_index(
+        'ix_oauth_clients_client_id',
+        'oauth_clients',
+        ['client_id'],
+        unique=True,
+        postgresql_include=['id', 'redirect_uris'],
+    )
+    op.create_index(
+        'ix_oauth_tokens_revoked_access_expires',
+        'oauth_tokens',
+        ['access_token_expires_at'],
+        postgresql_include=['access_token_jti'],
+        postgresql_where=sa.text('revoked'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_oauth_tokens_revoked_access_expires', table_name='oauth_tokens')
+    op.drop_index('ix_oauth_clients_client_id', table_name='oauth_clients')
+    op.create_index(op.f('ix_oauth_clients_client_id'), 'oauth_clients', ['client_id'], unique=True)
+
+    op.create_index('ix_tokens_refresh_expires', 'oauth_tokens', ['refresh_token_expires_at'], unique=False)
+    op.create_index('ix_tokens_access_expires', 'oauth_tokens', ['access_token_expires_at'], unique=False)
+    op.create_index(op.f('ix_oauth_tokens_id'), 'oauth_tokens', ['id'], unique=False)
+    op.create_index('ix_auth_codes_expires_at', 'oauth_authorization_codes', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_oauth_authorization_codes_id'), 'oauth_authorization_codes', ['id'], unique=False)
+    op.create_index(op.f('ix_oauth_clients_id'), 'oauth_clients', ['id'], unique=False)
@@ -0,0 +1,32 @@
+"""drop_raw_oauth_token_columns
+
+Revision ID: 9c2e7d14a6b3
+Revises: 0b6e4a93c7d8
+Create Date: 2026-10-15 15:42:37.218806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e7d14a6b3'
+down_revision: Union[str, Sequence[str], None] = '0b6e4a93c7d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tokens are only ever looked up by their SHA-256 hashes
+    op.drop_column('oauth_tokens', 'refresh_token')
+    op.drop_column('oauth_tokens', 'access_token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The raw values cannot be recovered, so existing rows are left NULL
+    op.add_column('oauth_tokens', sa.Column('access_token', sa.Text(), nullable=True))
+    op.add_column('oauth_tokens', sa.Column('refresh_token', sa.Text(), nullable=True))
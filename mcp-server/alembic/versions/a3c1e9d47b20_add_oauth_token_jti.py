@@ -0,0 +1,30 @@
+"""add_oauth_token_jti
+
+Revision ID: a3c1e9d47b20
+Revises: 5682052542e1
+Create Date: 2026-10-15 10:12:08.415230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c1e9d47b20'
+down_revision: Union[str, Sequence[str], None] = '5682052542e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tokens issued before this revision have no jti claim and stay NULL;
+    # they are still checked against the revoked column on every request.
+    op.add_column('oauth_tokens', sa.Column('access_token_jti', sa.String(length=36), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('oauth_tokens', 'access_token_jti')
@@ -0,0 +1,37 @@
+"""oauth_token_hashes_bytea
+
+Revision ID: b1f4d8e62a90
+Revises: 9c2e7d14a6b3
+Create Date: 2026-10-15 16:20:05.731942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1f4d8e62a90'
+down_revision: Union[str, Sequence[str], None] = '9c2e7d14a6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Store the 32-byte SHA-256 digests instead of their 64-character hex form
+    for column in ('access_token_hash', 'refresh_token_hash'):
+        op.alter_column('oauth_tokens', column,
+                   existing_type=sa.String(length=64),
+                   type_=sa.LargeBinary(length=32),
+                   postgresql_using=f"decode({column}, 'hex')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ('access_token_hash', 'refresh_token_hash'):
+        op.alter_column('oauth_tokens', column,
+                   existing_type=sa.LargeBinary(length=32),
+                   type_=sa.String(length=64),
+                   postgresql_using=f"encode({column}, 'hex')")
@@ -0,0 +1,57 @@
+"""oauth_token_revoked_boolean
+
+Revision ID: c7d2f5a81e36
+Revises: a3c1e9d47b20
+Create Date: 2026-10-15 11:03:41.208517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2f5a81e36'
+down_revision: Union[str, Sequence[str], None] = 'a3c1e9d47b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('valid_revoked_flag', 'oauth_tokens', type_='check')
+    op.alter_column(
+        'oauth_tokens',
+        'revoked',
+        existing_type=sa.String(length=10),
+        type_=sa.Boolean(),
+        existing_nullable=False,
+        server_default=sa.false(),
+        postgresql_using="revoked = 'true'",
+    )
+    # Cover the per-request revocation lookup so it is answered from the index alone
+    op.drop_index(op.f('ix_oauth_tokens_access_token_hash'), table_name='oauth_tokens')
+    op.create_index(
+        op.f('ix_oauth_tokens_access_token_hash'),
+        'oauth_tokens',
+        ['access_token_hash'],
+        unique=True,
+        postgresql_include=['revoked', 'access_token_expires_at'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_oauth_tokens_access_token_hash'), table_name='oauth_tokens')
+    op.create_index(op.f('ix_oauth_tokens_access_token_hash'), 'oauth_tokens', ['access_token_hash'], unique=True)
+    op.alter_column(
+        'oauth_tokens',
+        'revoked',
+        existing_type=sa.Boolean(),
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        server_default=None,
+        postgresql_using="CASE WHEN revoked THEN 'true' ELSE 'false' END",
+    )
+    op.create_check_constraint('valid_revoked_flag', 'oauth_tokens', "revoked IN ('true', 'false')")
@@ -0,0 +1,29 @@
+"""drop_duplicate_users_id_index
+
+Revision ID: d7a3c5e19f42
+Revises: b1f4d8e62a90
+Create Date: 2026-10-15 16:58:41.402277
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c5e19f42'
+down_revision: Union[str, Sequence[str], None] = 'b1f4d8e62a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicate of users_pkey; /authorize lookups go through ix_users_oauth_sub
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
@@ -0,0 +1,47 @@
+"""oauth_client_jsonb_columns
+
+Revision ID: e41b8c07d5f2
+Revises: c7d2f5a81e36
+Create Date: 2026-10-15 11:47:19.562044
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b8c07d5f2'
+down_revision: Union[str, Sequence[str], None] = 'c7d2f5a81e36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = ('redirect_uris', 'grant_types', 'response_types')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'oauth_clients',
+            column,
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=False,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'oauth_clients',
+            column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.Text(),
+            existing_nullable=False,
+            postgresql_using=f'{column}::text',
+        )
@@ -0,0 +1,46 @@
+"""oauth_code_used_boolean
+
+Revision ID: f58a2d9c3b14
+Revises: e41b8c07d5f2
+Create Date: 2026-10-15 12:21:54.730962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f58a2d9c3b14'
+down_revision: Union[str, Sequence[str], None] = 'e41b8c07d5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('valid_used_flag', 'oauth_authorization_codes', type_='check')
+    op.alter_column(
+        'oauth_authorization_codes',
+        'used',
+        existing_type=sa.String(length=10),
+        type_=sa.Boolean(),
+        existing_nullable=False,
+        server_default=sa.false(),
+        postgresql_using="used = 'true'",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'oauth_authorization_codes',
+        'used',
+        existing_type=sa.Boolean(),
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        server_default=None,
+        postgresql_using="CASE WHEN used THEN 'true' ELSE 'false' END",
+    )
+    op.create_check_constraint('valid_used_flag', 'oauth_authorization_codes', "used IN ('true', 'false')")
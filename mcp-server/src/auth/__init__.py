@@ -1,14 +1,31 @@
 """Authentication and authorization utilities for OAuth 2.0."""
 
-from .jwt_utils import create_access_token, create_refresh_token, decode_token, verify_token
+from jwt import ExpiredSignatureError, InvalidTokenError
+
+from .jwt_utils import (
+    create_access_token,
+    create_refresh_token,
+    create_token_pair,
+    decode_token,
+    is_asymmetric_algorithm,
+    preload_keys,
+    run_token_signing,
+    verify_token,
+)
 from .pkce import verify_pkce_challenge, generate_random_string, compute_code_challenge
 
 __all__ = [
     "create_access_token",
     "create_refresh_token",
+    "create_token_pair",
     "decode_token",
     "verify_token",
+    "is_asymmetric_algorithm",
+    "preload_keys",
+    "run_token_signing",
     "verify_pkce_challenge",
     "compute_code_challenge",
     "generate_random_string",
+    "ExpiredSignatureError",
+    "InvalidTokenError",
 ]
@@ -1,63 +1,161 @@
 """JWT token generation and validation utilities."""
 
+import asyncio
 import jwt
+import orjson
+from cryptography.hazmat.primitives import serialization
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
-from uuid import UUID
+from functools import lru_cache
+import time
+from typing import Callable, Dict, Any, Optional, TypeVar
+from uuid import UUID, uuid4
 from pathlib import Path
 from ..config import settings
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
 
-def _load_rsa_key(key_path: Optional[str], key_type: str = "private") -> Optional[str]:
-    """Load RSA key from file path."""
+# Algorithms signed with a private key and verified with a public key (PEM files).
+# EdDSA (Ed25519) is the recommended choice: verification is several times faster
+# than RS256, which matters because every protected request verifies a token.
+ASYMMETRIC_ALGORITHMS = frozenset(
+    {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "EdDSA"}
+)
+
+
+# Issuer/audience claims are fixed for the life of the process; build them once
+# and copy the template for each token instead of re-reading settings.
+_ISSUER = settings.oauth_issuer or settings.public_base_url
+_AUDIENCE = settings.public_base_url
+_BASE_PAYLOAD: Dict[str, Any] = {"iss": _ISSUER, "aud": _AUDIENCE}
+
+# Claims every token we issue carries; PyJWT rejects tokens missing any of them
+# during the same decode that checks the signature, expiry, issuer and audience.
+_DECODE_OPTIONS: Dict[str, Any] = {"require": ["exp", "iat", "sub", "token_type"]}
+
+# HS* shared secret (and asymmetric fallback) as bytes, so PyJWT does not
+# re-encode the str on every sign and verify.
+_JWT_SECRET = settings.jwt_secret.encode("utf-8")
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with orjson for claim (de)serialization.
+
+    _encode_payload and _decode_payload are private PyJWT methods, not a public
+    API; pyproject pins PyJWT to the minor version they were checked against.
+    """
+
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: Dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+
+def is_asymmetric_algorithm(algorithm: str) -> bool:
+    """Return True if the JWT algorithm uses a private/public key pair."""
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+@lru_cache(maxsize=4)
+def _load_pem_key(key_path: Optional[str], key_type: str = "private") -> Optional[str]:
+    """Load a PEM key from file path (read once per path and cached)."""
     if not key_path:
         return None
 
     try:
         key_file = Path(key_path)
         if not key_file.exists():
-            logger.warning(f"RSA {key_type} key file not found: {key_path}")
+            logger.warning(f"JWT {key_type} key file not found: {key_path}")
             return None
 
         with open(key_file, "r") as f:
             key_content = f.read()
 
-        logger.info(f"Successfully loaded RSA {key_type} key from {key_path}")
+        logger.info(f"Successfully loaded JWT {key_type} key from {key_path}")
         return key_content
     except Exception as e:
-        logger.error(f"Failed to load RSA {key_type} key: {e}")
+        logger.error(f"Failed to load JWT {key_type} key: {e}")
         return None
 
 
-def _get_signing_key() -> str:
-    """Get the signing key for JWT (RSA private key or HS256 secret)."""
-    if settings.jwt_algorithm.startswith("RS"):
-        # RS256/RS384/RS512 - use RSA private key
-        private_key = _load_rsa_key(settings.jwt_private_key_path, "private")
+@lru_cache(maxsize=2)
+def _load_signing_key(algorithm: str, key_path: Optional[str]) -> Any:
+    """Build the signing key once per (algorithm, key path) pair.
+
+    PEM keys are parsed into a key object up front so PyJWT does not re-parse
+    (and re-validate) the PEM on every ``jwt.encode`` call.
+    """
+    if is_asymmetric_algorithm(algorithm):
+        # RS*/ES*/EdDSA - use private key
+        private_key = _load_pem_key(key_path, "private")
         if not private_key:
-            logger.warning("RSA private key not available, falling back to HS256 with jwt_secret")
-            return settings.jwt_secret
-        return private_key
+            logger.warning(f"{algorithm} private key not available, falling back to jwt_secret")
+            return _JWT_SECRET
+        return serialization.load_pem_private_key(private_key.encode("utf-8"), password=None)
     else:
         # HS256/HS384/HS512 - use shared secret
-        return settings.jwt_secret
+        return _JWT_SECRET
 
 
-def _get_verification_key() -> str:
-    """Get the verification key for JWT (RSA public key or HS256 secret)."""
-    if settings.jwt_algorithm.startswith("RS"):
-        # RS256/RS384/RS512 - use RSA public key
-        public_key = _load_rsa_key(settings.jwt_public_key_path, "public")
+@lru_cache(maxsize=2)
+def _load_verification_key(algorithm: str, key_path: Optional[str]) -> Any:
+    """Build the verification key once per (algorithm, key path) pair."""
+    if is_asymmetric_algorithm(algorithm):
+        # RS*/ES*/EdDSA - use public key
+        public_key = _load_pem_key(key_path, "public")
         if not public_key:
-            logger.warning("RSA public key not available, falling back to HS256 with jwt_secret")
-            return settings.jwt_secret
-        return public_key
+            logger.warning(f"{algorithm} public key not available, falling back to jwt_secret")
+            return _JWT_SECRET
+        return serialization.load_pem_public_key(public_key.encode("utf-8"))
     else:
         # HS256/HS384/HS512 - use shared secret
-        return settings.jwt_secret
+        return _JWT_SECRET
+
+
+def _get_signing_key() -> Any:
+    """Get the signing key for JWT (private key or HS256 secret)."""
+    return _load_signing_key(settings.jwt_algorithm, settings.jwt_private_key_path)
+
+
+def _get_verification_key() -> Any:
+    """Get the verification key for JWT (public key or HS256 secret)."""
+    return _load_verification_key(settings.jwt_algorithm, settings.jwt_public_key_path)
+
+
+def preload_keys() -> None:
+    """
+    Load and parse the signing and verification keys.
+
+    Call once at startup so the first token request does not read PEM files
+    from disk on the event loop.
+    """
+    _get_signing_key()
+    _get_verification_key()
+
+
+async def run_token_signing(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Call a token-creating function without blocking the event loop.
+
+    Private-key signatures (RS*/ES*/EdDSA) take up to several milliseconds and
+    OpenSSL releases the GIL while computing them, so they run in the default
+    thread pool. HMAC signing takes microseconds and runs inline.
+    """
+    if is_asymmetric_algorithm(settings.jwt_algorithm):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return func(*args, **kwargs)
 
 
 def create_access_token(
@@ -65,6 +163,7 @@ def create_access_token(
     client_id: str,
     scope: str,
     expires_delta: Optional[timedelta] = None,
+    jti: Optional[str] = None,
 ) -> tuple[str, datetime]:
     """
     Create a JWT access token.
@@ -74,29 +173,33 @@ def create_access_token(
         client_id: OAuth client ID
         scope: Space-separated scope string
         expires_delta: Custom expiration time (defaults to settings.access_token_expire_minutes)
+        jti: Token ID used for revocation (defaults to a random UUID)
 
     Returns:
         Tuple of (token_string, expiration_datetime)
     """
     if expires_delta is None:
-        expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
-
-    now = datetime.now(timezone.utc)
-    expires_at = now + expires_delta
-
-    payload = {
-        "sub": str(user_id),  # Subject: user ID
-        "client_id": client_id,  # OAuth client
-        "scope": scope,  # Granted scopes
-        "iss": settings.oauth_issuer or settings.public_base_url,  # Issuer
-        "aud": settings.public_base_url,  # Audience
-        "iat": int(now.timestamp()),  # Issued at
-        "exp": int(expires_at.timestamp()),  # Expiration
-        "token_type": "access_token",
-    }
+        expires_in = settings.access_token_expire_minutes * 60
+    else:
+        expires_in = int(expires_delta.total_seconds())
+
+    now = int(time.time())
+    exp = now + expires_in
+
+    payload = _BASE_PAYLOAD.copy()  # Issuer and audience
+    payload.update(
+        sub=str(user_id),  # Subject: user ID
+        client_id=client_id,  # OAuth client
+        scope=scope,  # Granted scopes
+        iat=now,  # Issued at
+        exp=exp,  # Expiration
+        jti=jti or str(uuid4()),  # Token ID
+        token_type="access_token",
+    )
 
     signing_key = _get_signing_key()
-    token = jwt.encode(payload, signing_key, algorithm=settings.jwt_algorithm)
+    token = _jwt.encode(payload, signing_key, algorithm=settings.jwt_algorithm)
+    expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
 
     logger.info(f"Created access token for user {user_id} with scope '{scope}', expires at {expires_at}")
     return token, expires_at
@@ -121,29 +224,80 @@ def create_refresh_token(
         Tuple of (token_string, expiration_datetime)
     """
     if expires_delta is None:
-        expires_delta = timedelta(days=settings.refresh_token_expire_days)
-
-    now = datetime.now(timezone.utc)
-    expires_at = now + expires_delta
-
-    payload = {
-        "sub": str(user_id),
-        "client_id": client_id,
-        "scope": scope,
-        "iss": settings.oauth_issuer or settings.public_base_url,
-        "aud": settings.public_base_url,
-        "iat": int(now.timestamp()),
-        "exp": int(expires_at.timestamp()),
-        "token_type": "refresh_token",
-    }
+        expires_in = settings.refresh_token_expire_days * 86400
+    else:
+        expires_in = int(expires_delta.total_seconds())
+
+    now = int(time.time())
+    exp = now + expires_in
+
+    payload = _BASE_PAYLOAD.copy()
+    payload.update(
+        sub=str(user_id),
+        client_id=client_id,
+        scope=scope,
+        iat=now,
+        exp=exp,
+        token_type="refresh_token",
+    )
 
     signing_key = _get_signing_key()
-    token = jwt.encode(payload, signing_key, algorithm=settings.jwt_algorithm)
+    token = _jwt.encode(payload, signing_key, algorithm=settings.jwt_algorithm)
+    expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
 
     logger.info(f"Created refresh token for user {user_id}, expires at {expires_at}")
     return token, expires_at
 
 
+def create_token_pair(
+    user_id: UUID,
+    client_id: str,
+    scope: str,
+    jti: Optional[str] = None,
+) -> tuple[str, datetime, str, datetime]:
+    """
+    Create an access token and a refresh token in one go.
+
+    Both tokens share the issue time, signing key and claim skeleton.
+
+    Args:
+        user_id: User UUID
+        client_id: OAuth client ID
+        scope: Space-separated scope string
+        jti: Access token ID used for revocation (defaults to a random UUID)
+
+    Returns:
+        Tuple of (access_token, access_expiration, refresh_token, refresh_expiration)
+    """
+    now = int(time.time())
+    access_exp = now + settings.access_token_expire_minutes * 60
+    refresh_exp = now + settings.refresh_token_expire_days * 86400
+    signing_key = _get_signing_key()
+    algorithm = settings.jwt_algorithm
+
+    base = _BASE_PAYLOAD.copy()
+    base.update(sub=str(user_id), client_id=client_id, scope=scope, iat=now)
+
+    access_token = _jwt.encode(
+        {**base, "exp": access_exp, "jti": jti or str(uuid4()), "token_type": "access_token"},
+        signing_key,
+        algorithm=algorithm,
+    )
+    refresh_token = _jwt.encode(
+        {**base, "exp": refresh_exp, "token_type": "refresh_token"},
+        signing_key,
+        algorithm=algorithm,
+    )
+    access_expires_at = datetime.fromtimestamp(access_exp, tz=timezone.utc)
+    refresh_expires_at = datetime.fromtimestamp(refresh_exp, tz=timezone.utc)
+
+    logger.info(
+        f"Created token pair for user {user_id} with scope '{scope}', "
+        f"access expires at {access_expires_at}"
+    )
+    return access_token, access_expires_at, refresh_token, refresh_expires_at
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode a JWT token without verification (for debugging/inspection).
@@ -155,7 +309,7 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         Decoded payload or None if invalid
     """
     try:
-        payload = jwt.decode(token, options={"verify_signature": False})
+        payload = _jwt.decode(token, options={"verify_signature": False})
         return payload
     except jwt.DecodeError as e:
         logger.error(f"Failed to decode token: {e}")
@@ -180,12 +334,13 @@ def verify_token(token: str, expected_token_type: str = "access_token") -> Optio
     try:
         verification_key = _get_verification_key()
 
-        payload = jwt.decode(
+        payload = _jwt.decode(
             token,
             verification_key,
             algorithms=[settings.jwt_algorithm],
-            audience=settings.public_base_url,
-            issuer=settings.oauth_issuer or settings.public_base_url,
+            audience=_AUDIENCE,
+            issuer=_ISSUER,
+            options=_DECODE_OPTIONS,
         )
 
         # Verify token type matches expectation
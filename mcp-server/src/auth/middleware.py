@@ -2,20 +2,91 @@
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
-from typing import Optional, Callable
-import jwt
+from sqlalchemy import bindparam, select
+from typing import Any, Optional, Callable
+from cachetools import TLRUCache, TTLCache
+import re
+import time
 
 from ..database import AsyncSessionLocal
 from ..config import settings
 from ..models.database import OAuthToken
-from ..auth import verify_token
+from . import ExpiredSignatureError, InvalidTokenError, verify_token
+from .revocation import is_jti_revoked
 from .token_utils import hash_token
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _verified_token_ttu(_key: bytes, payload: dict[str, Any], now: float) -> float:
+    """Expire cached payloads at the token's own exp or after the configured TTL."""
+    return min(payload["exp"], now + settings.token_cache_ttl_seconds)
+
+
+# Verified access token payloads keyed by a truncated SHA-256 of the token.
+# Only successful verifications are cached, so a forged token always pays the
+# full signature check. Entries never outlive the token's exp claim.
+_verified_token_cache: TLRUCache = TLRUCache(
+    maxsize=settings.token_cache_max_size,
+    ttu=_verified_token_ttu,
+    timer=time.time,
+)
+
+# DB revocation status per access token hash: (revoked, access_token_expires_at
+# as a unix timestamp). Bounds how long a revocation takes to reach other
+# workers; revocations handled by this process invalidate immediately.
+_revocation_cache: TTLCache = TTLCache(
+    maxsize=settings.token_cache_max_size,
+    ttl=settings.revocation_cache_ttl_seconds,
+)
+
+
+# Revocation status lookup, built once. SQLAlchemy reuses its compiled form and
+# asyncpg its server-side prepared statement; only the columns covered by the
+# access_token_hash index are selected.
+_TOKEN_STATUS_QUERY = select(OAuthToken.revoked, OAuthToken.access_token_expires_at).where(
+    OAuthToken.access_token_hash == bindparam("token_hash")
+)
+
+
+def invalidate_cached_token(access_token_hash: bytes) -> None:
+    """Drop the cached revocation status for an access token hash."""
+    _revocation_cache.pop(access_token_hash, None)
+
+
+def cache_issued_token(access_token_hash: bytes, expires_at: float) -> None:
+    """Record a freshly issued access token so its first use skips the status query."""
+    _revocation_cache[access_token_hash] = (False, expires_at)
+
+
+# Endpoints that never require a bearer token (OAuth flow, discovery, health, docs)
+PUBLIC_PATH_PREFIXES = (
+    "/health",
+    "/manifest.json",
+    "/.well-known/",
+    "/authorize",
+    "/login",
+    "/token",
+    "/revoke",
+    "/register",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+)
+
+
+# Exact public paths (health checks, probes, docs) answered before any prefix matching
+PUBLIC_EXACT_PATHS = frozenset(
+    {"/health", "/manifest.json", "/openapi.json", "/docs", "/redoc"}
+)
+
+
+def _compile_prefix_pattern(prefixes: list[str] | tuple[str, ...]) -> re.Pattern[str]:
+    """Compile path prefixes into one anchored regex so matching is a single C call."""
+    return re.compile("(?:" + "|".join(re.escape(prefix) for prefix in prefixes) + ")")
+
+
 class OAuthMiddleware:
     """
     Middleware to protect endpoints with OAuth Bearer token authentication.
@@ -33,19 +104,25 @@ class OAuthMiddleware:
                             If None or empty, all paths except OAuth endpoints are protected.
         """
         self.protected_paths = protected_paths or []
+        self._public_re = _compile_prefix_pattern(PUBLIC_PATH_PREFIXES)
+        self._protect_re = (
+            _compile_prefix_pattern(self.protected_paths) if self.protected_paths else None
+        )
+
+        # Static tail of the WWW-Authenticate challenge, shared by every 401
+        auth_params = []
+        if settings.public_base_url:
+            base_url = settings.public_base_url.rstrip("/")
+            auth_params.append(f'resource_metadata="{base_url}/.well-known/oauth-protected-resource"')
+        auth_params.append('scope="tasks.read tasks.write offline_access"')
+        self._www_authenticate_suffix = ", " + ", ".join(auth_params)
 
     async def __call__(self, request: Request, call_next: Callable):
         """Process the request and verify OAuth token if needed."""
-        if request.method == "OPTIONS":
-            return await call_next(request)
         path = request.url.path
 
-        # Skip authentication for OAuth endpoints and health/manifest
-        if self._is_public_path(path):
-            return await call_next(request)
-
-        # Check if path should be protected
-        if not self._should_protect(path):
+        # CORS preflights, OAuth endpoints, health/manifest and unprotected paths pass through
+        if request.method == "OPTIONS" or not self._requires_token(path):
             return await call_next(request)
 
         # Extract and verify token
@@ -54,41 +131,63 @@ class OAuthMiddleware:
             logger.warning(f"Missing Authorization header for protected path: {path}")
             return self._unauthorized_response("Missing Authorization header")
 
-        # Verify JWT token
-        try:
-            payload = verify_token(token, expected_token_type="access_token")
-        except jwt.ExpiredSignatureError:
-            logger.info(f"Expired token for path: {path}")
-            return self._unauthorized_response("Token has expired", error="invalid_token")
-        except jwt.InvalidTokenError as e:
-            logger.warning(f"Invalid token for path {path}: {e}")
-            return self._unauthorized_response("Invalid token", error="invalid_token")
-        except Exception as e:
-            logger.error(f"Unexpected error verifying token: {e}")
-            return self._unauthorized_response("Token verification failed")
+        # Verify JWT token (reusing a recent verification when available)
+        # Hash the token once: the digest prefix keys the verification cache and
+        # the full digest is the stored access_token_hash.
+        digest = hash_token(token)
+        cache_key = digest[:16]
+        payload = _verified_token_cache.get(cache_key)
+        if payload is not None and payload["exp"] <= time.time():
+            payload = None
+        if payload is None:
+            try:
+                payload = verify_token(token, expected_token_type="access_token")
+            except ExpiredSignatureError:
+                logger.info(f"Expired token for path: {path}")
+                return self._unauthorized_response("Token has expired", error="invalid_token")
+            except InvalidTokenError as e:
+                logger.warning(f"Invalid token for path {path}: {e}")
+                return self._unauthorized_response("Invalid token", error="invalid_token")
+            except Exception as e:
+                logger.error(f"Unexpected error verifying token: {e}")
+                return self._unauthorized_response("Token verification failed")
+
+            if not payload:
+                return self._unauthorized_response("Invalid token")
 
-        if not payload:
-            return self._unauthorized_response("Invalid token")
+            if "exp" in payload:
+                _verified_token_cache[cache_key] = payload
+
+        # Revocations published by any worker are rejected without a database
+        # round-trip; the per-token status check below stays authoritative.
+        if is_jti_revoked(payload.get("jti")):
+            logger.warning(f"Revoked token used for path: {path}")
+            return self._unauthorized_response("Token has been revoked", error="invalid_token")
 
         # Check if token is revoked in database
-        async with AsyncSessionLocal() as db:
-            token_hash = hash_token(token)
-            result = await db.execute(
-                select(OAuthToken).where(OAuthToken.access_token_hash == token_hash)
-            )
-            token_record = result.scalar_one_or_none()
-
-            if not token_record:
+        token_status = _revocation_cache.get(digest)
+        if token_status is None:
+            # Short-lived session: the connection goes back to the pool before
+            # the request is handled (tools open their own sessions).
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(_TOKEN_STATUS_QUERY, {"token_hash": digest})
+                token_row = result.one_or_none()
+
+            if token_row is None:
                 logger.warning("Token not found in database")
                 return self._unauthorized_response("Token not found", error="invalid_token")
 
-            if token_record.revoked == "true":
-                logger.warning(f"Revoked token used for path: {path}")
-                return self._unauthorized_response("Token has been revoked", error="invalid_token")
+            token_status = (token_row.revoked, token_row.access_token_expires_at.timestamp())
+            _revocation_cache[digest] = token_status
 
-            if token_record.is_access_token_expired:
-                logger.info(f"Expired token in database for path: {path}")
-                return self._unauthorized_response("Token has expired", error="invalid_token")
+        revoked, expires_at = token_status
+        if revoked:
+            logger.warning(f"Revoked token used for path: {path}")
+            return self._unauthorized_response("Token has been revoked", error="invalid_token")
+
+        if expires_at < time.time():
+            logger.info(f"Expired token in database for path: {path}")
+            return self._unauthorized_response("Token has expired", error="invalid_token")
 
         # Attach user info to request state for downstream use
         request.state.user_id = payload.get("sub")
@@ -100,31 +199,13 @@ class OAuthMiddleware:
         # Proceed with request
         return await call_next(request)
 
-    def _is_public_path(self, path: str) -> bool:
-        """Check if path is a public endpoint that doesn't require authentication."""
-        public_paths = [
-            "/health",
-            "/manifest.json",
-            "/.well-known/",
-            "/authorize",
-            "/login",
-            "/token",
-            "/revoke",
-            "/register",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-        ]
-        return any(path.startswith(prefix) for prefix in public_paths)
-
-    def _should_protect(self, path: str) -> bool:
-        """Determine if the path should be protected."""
-        if not self.protected_paths:
-            # If no specific paths defined, protect everything except public paths
-            return True
-
-        # Check if path matches any protected path prefix
-        return any(path.startswith(prefix) for prefix in self.protected_paths)
+    def _requires_token(self, path: str) -> bool:
+        """Classify a path in one pass: public endpoints never need a token."""
+        if path in PUBLIC_EXACT_PATHS or self._public_re.match(path) is not None:
+            return False
+
+        # If no specific paths defined, protect everything except public paths
+        return self._protect_re is None or self._protect_re.match(path) is not None
 
     def _extract_bearer_token(self, request: Request) -> Optional[str]:
         """
@@ -139,6 +220,7 @@ class OAuthMiddleware:
         if not auth_header:
             return None
 
+        # Scheme and token may be separated by any run of whitespace
         parts = auth_header.split()
         if len(parts) != 2 or parts[0].lower() != "bearer":
             logger.warning(f"Invalid Authorization header format: {auth_header[:20]}...")
@@ -154,24 +236,13 @@ class OAuthMiddleware:
 
         Follows RFC 6750 (The OAuth 2.0 Authorization Framework: Bearer Token Usage).
         """
-        resource_metadata = None
-        if settings.public_base_url:
-            base_url = settings.public_base_url.rstrip("/")
-            resource_metadata = f'{base_url}/.well-known/oauth-protected-resource'
-
-        auth_params = [
-            'realm="MCP"',
-            f'error="{error}"',
-            f'error_description="{description}"',
-        ]
-        if resource_metadata:
-            auth_params.append(f'resource_metadata="{resource_metadata}"')
-        auth_params.append('scope="tasks.read tasks.write offline_access"')
-
         return JSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"error": error, "error_description": description},
             headers={
-                "WWW-Authenticate": "Bearer " + ", ".join(auth_params)
+                "WWW-Authenticate": (
+                    f'Bearer realm="MCP", error="{error}", error_description="{description}"'
+                    + self._www_authenticate_suffix
+                )
             },
         )
@@ -1,15 +1,21 @@
 """OAuth 2.0 endpoints for ChatGPT Apps integration."""
 
 from fastapi import APIRouter, HTTPException, status, Depends, Form, Query, Request
-from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse, HTMLResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from datetime import datetime, timedelta, timezone
-from typing import Optional
-import json
+from sqlalchemy import bindparam, func, select, update
+from datetime import timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from cachetools import TLRUCache, TTLCache
+import asyncio
+import html
+import re
 import secrets
+import time
+import uuid
 import jwt
-from urllib.parse import urlparse
+from urllib.parse import urlencode, urlparse
 
 from ..database import get_db
 from ..config import settings
@@ -32,49 +38,125 @@ from ..models.oauth import (
 )
 from ..auth import (
     create_access_token,
-    create_refresh_token,
+    create_token_pair,
     verify_token,
     verify_pkce_challenge,
     generate_random_string,
+    is_asymmetric_algorithm,
+    run_token_signing,
 )
+from .jwt_utils import _get_signing_key, _get_verification_key
+from .middleware import cache_issued_token, invalidate_cached_token
+from .revocation import mark_jti_revoked, publish_jti_revoked
 from .token_utils import hash_token
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # Helper functions
-def oauth_error_response(error: str, description: Optional[str] = None, status_code: int = 400):
-    """Create OAuth error response."""
-    return JSONResponse(
-        status_code=status_code,
+@lru_cache(maxsize=64)
+def oauth_error_response(
+    error: str, description: Optional[str] = None, status_code: int = 400
+) -> Response:
+    """
+    Create OAuth error response.
+
+    Every call site passes constant arguments, so each distinct error is
+    serialized once and the same immutable response is returned afterwards.
+    """
+    return Response(
         content=TokenErrorResponse(
             error=error,
             error_description=description,
-        ).model_dump(exclude_none=True),
+        ).model_dump_json(exclude_none=True),
+        status_code=status_code,
+        media_type="application/json",
     )
 
 
-async def get_client_by_client_id(db: AsyncSession, client_id: str) -> Optional[OAuthClient]:
-    """Get OAuth client by client_id."""
-    result = await db.execute(select(OAuthClient).where(OAuthClient.client_id == client_id))
-    return result.scalar_one_or_none()
+class CachedClient(NamedTuple):
+    """Detached snapshot of the OAuthClient fields the OAuth flow needs."""
+
+    id: uuid.UUID
+    client_id: str
+    redirect_uris: frozenset[str]  # Decoded once per cache fill; O(1) membership
+
+
+# client_id -> CachedClient. Clients only change on /register, so a short TTL
+# is enough; unknown client_ids are not cached.
+_client_cache: TTLCache = TTLCache(maxsize=1024, ttl=settings.client_cache_ttl_seconds)
+
+# client_id -> lookup in progress. Concurrent cache misses for the same client
+# wait for the first request's query instead of each issuing their own.
+_client_lookups: dict[str, asyncio.Future] = {}
+
+
+def _verified_refresh_ttu(_key: bytes, payload: dict, now: float) -> float:
+    return min(payload["exp"], now + settings.token_cache_ttl_seconds)
+
+
+# refresh_token_hash -> verified refresh token payload. Skips the signature
+# check when a client retries a refresh; revocation is still read from the
+# database on every grant.
+_verified_refresh_cache: TLRUCache = TLRUCache(
+    maxsize=settings.token_cache_max_size,
+    ttu=_verified_refresh_ttu,
+    timer=time.time,
+)
+
+
+async def get_client_by_client_id(db: AsyncSession, client_id: str) -> Optional[CachedClient]:
+    """Get OAuth client by client_id, reusing a recent lookup when available."""
+    client = _client_cache.get(client_id)
+    if client is not None:
+        return client
+
+    pending = _client_lookups.get(client_id)
+    if pending is not None:
+        await asyncio.wait([pending])
+        # Fall back to querying ourselves if the first request was cancelled
+        if not pending.cancelled():
+            return pending.result()
+
+    pending = asyncio.get_running_loop().create_future()
+    _client_lookups[client_id] = pending
+    try:
+        result = await db.execute(
+            select(OAuthClient.id, OAuthClient.client_id, OAuthClient.redirect_uris).where(
+                OAuthClient.client_id == client_id
+            )
+        )
+        row = result.one_or_none()
+        if row is not None:
+            client = CachedClient(row.id, row.client_id, frozenset(row.redirect_uris))
+            _client_cache[client_id] = client
+        pending.set_result(client)
+        return client
+    finally:
+        if not pending.done():
+            pending.cancel()
+        if _client_lookups.get(client_id) is pending:
+            del _client_lookups[client_id]
 
 
 def _normalize_base_url(url: str) -> str:
     return url.rstrip("/")
 
 
-def _validate_resource(resource: Optional[str]) -> Optional[JSONResponse]:
+# The only resource indicator (RFC 8707) this server accepts; empty disables the check
+_EXPECTED_RESOURCE = _normalize_base_url(settings.public_base_url)
+
+
+def _validate_resource(resource: Optional[str]) -> Optional[Response]:
     if not resource:
         return None
-    expected = _normalize_base_url(settings.public_base_url)
-    if not expected:
+    if not _EXPECTED_RESOURCE:
         logger.warning("Resource validation skipped because PUBLIC_BASE_URL is empty")
         return None
-    if _normalize_base_url(resource) != expected:
-        logger.warning(f"Invalid resource requested: {resource} (expected {expected})")
+    if _normalize_base_url(resource) != _EXPECTED_RESOURCE:
+        logger.warning(f"Invalid resource requested: {resource} (expected {_EXPECTED_RESOURCE})")
         return oauth_error_response("invalid_target", "Unknown resource")
     return None
 
@@ -83,16 +165,19 @@ def _demo_login_enabled() -> bool:
     return bool(settings.demo_username and settings.demo_password)
 
 
+_DEMO_SESSION_DECODE_OPTIONS = {"require": ["exp", "iat", "sub", "type"]}
+
+
 def _create_demo_session_token(username: str) -> str:
-    now = datetime.now(timezone.utc)
-    expires_at = now + timedelta(minutes=settings.demo_session_ttl_minutes)
+    now = int(time.time())
     payload = {
         "sub": username,
-        "iat": int(now.timestamp()),
-        "exp": int(expires_at.timestamp()),
+        "iat": now,
+        "exp": now + settings.demo_session_ttl_minutes * 60,
         "type": "demo_session",
     }
-    return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
+    # Signed with the same key and algorithm as access tokens
+    return jwt.encode(payload, _get_signing_key(), algorithm=settings.jwt_algorithm)
 
 
 def _get_demo_username_from_cookie(request: Request) -> Optional[str]:
@@ -100,7 +185,12 @@ def _get_demo_username_from_cookie(request: Request) -> Optional[str]:
     if not token:
         return None
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        payload = jwt.decode(
+            token,
+            _get_verification_key(),
+            algorithms=[settings.jwt_algorithm],
+            options=_DEMO_SESSION_DECODE_OPTIONS,
+        )
     except Exception:
         return None
     if payload.get("type") != "demo_session":
@@ -119,9 +209,9 @@ def _safe_return_path(return_url: str | None) -> str:
     return return_url
 
 
-def _login_page(return_url: str, error: Optional[str] = None) -> str:
-    error_html = f"<p style='color:#b91c1c;'>{error}</p>" if error else ""
-    return f"""
+# The sign-in page is static apart from the error line and the return URL: its
+# fixed parts are encoded once, and the (escaped) dynamic values spliced in.
+_LOGIN_PAGE_TEMPLATE = """
 <!doctype html>
 <html lang="en">
   <head>
@@ -129,12 +219,12 @@ def _login_page(return_url: str, error: Optional[str] = None) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1" />
     <title>Sign in</title>
     <style>
-      body {{ font-family: system-ui, -apple-system, sans-serif; margin: 40px; }}
-      .card {{ max-width: 420px; margin: 0 auto; padding: 24px; border: 1px solid #e5e7eb; border-radius: 12px; }}
-      label {{ display: block; margin: 12px 0 6px; font-weight: 600; }}
-      input {{ width: 100%; padding: 10px; border: 1px solid #d1d5db; border-radius: 8px; }}
-      button {{ margin-top: 16px; width: 100%; padding: 10px; border: 0; border-radius: 8px; background: #111827; color: #fff; font-weight: 600; }}
-      .hint {{ color: #6b7280; font-size: 14px; }}
+      body { font-family: system-ui, -apple-system, sans-serif; margin: 40px; }
+      .card { max-width: 420px; margin: 0 auto; padding: 24px; border: 1px solid #e5e7eb; border-radius: 12px; }
+      label { display: block; margin: 12px 0 6px; font-weight: 600; }
+      input { width: 100%; padding: 10px; border: 1px solid #d1d5db; border-radius: 8px; }
+      button { margin-top: 16px; width: 100%; padding: 10px; border: 0; border-radius: 8px; background: #111827; color: #fff; font-weight: 600; }
+      .hint { color: #6b7280; font-size: 14px; }
     </style>
   </head>
   <body>
@@ -154,6 +244,100 @@ def _login_page(return_url: str, error: Optional[str] = None) -> str:
   </body>
 </html>
 """.strip()
+_LOGIN_PAGE_HEAD, _LOGIN_PAGE_FORM, _LOGIN_PAGE_TAIL = (
+    part.encode("utf-8")
+    for part in re.split(r"\{error_html\}|\{return_url\}", _LOGIN_PAGE_TEMPLATE)
+)
+
+
+def _login_page(return_url: str, error: Optional[str] = None) -> bytes:
+    error_html = (
+        f"<p style='color:#b91c1c;'>{html.escape(error)}</p>".encode("utf-8") if error else b""
+    )
+    return b"".join(
+        (
+            _LOGIN_PAGE_HEAD,
+            error_html,
+            _LOGIN_PAGE_FORM,
+            html.escape(return_url).encode("utf-8"),
+            _LOGIN_PAGE_TAIL,
+        )
+    )
+
+
+def _build_protected_resource_metadata() -> bytes:
+    issuer = _normalize_base_url(settings.oauth_issuer or settings.public_base_url)
+    return OAuthProtectedResourceMetadataResponse(
+        resource=_EXPECTED_RESOURCE,
+        authorization_servers=[issuer],
+        scopes_supported=["tasks.read", "tasks.write", "offline_access"],
+    ).model_dump_json().encode()
+
+
+def _build_authorization_server_metadata() -> bytes:
+    issuer = _normalize_base_url(settings.oauth_issuer or settings.public_base_url)
+    return OAuthMetadataResponse(
+        issuer=issuer,
+        authorization_endpoint=f"{issuer}/authorize",
+        token_endpoint=f"{issuer}/token",
+        registration_endpoint=f"{issuer}/register",
+        revocation_endpoint=f"{issuer}/revoke",
+        jwks_uri=(
+            f"{issuer}/.well-known/jwks.json"
+            if is_asymmetric_algorithm(settings.jwt_algorithm)
+            else None
+        ),
+        response_types_supported=["code"],
+        grant_types_supported=["authorization_code", "refresh_token"],
+        token_endpoint_auth_methods_supported=["none"],  # PKCE public clients
+        code_challenge_methods_supported=["S256", "plain"],
+        scopes_supported=["tasks.read", "tasks.write", "offline_access"],
+    ).model_dump_json().encode()
+
+
+# Discovery documents depend only on settings; serialize them once
+_PROTECTED_RESOURCE_METADATA = _build_protected_resource_metadata()
+_AUTHORIZATION_SERVER_METADATA = _build_authorization_server_metadata()
+_EMPTY_JWKS = JWKSet(keys=[]).model_dump_json().encode()
+
+# ...and only change on redeploy, so clients and proxies may reuse them
+_DISCOVERY_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# Authorization codes are stamped and checked against the database clock
+# (expires_at > now() in the /token exchange), so no datetime math runs here
+_AUTHORIZATION_CODE_LIFETIME = timedelta(minutes=settings.authorization_code_expire_minutes)
+
+# Authorization codes currently being exchanged by this process. Entries live
+# only for the duration of one /token call.
+_codes_in_flight: set[str] = set()
+
+# /revoke always answers with the same empty body, so one immutable response is
+# shared by every call (nothing on the request path mutates its headers)
+_REVOKE_OK = Response(content=b"{}", media_type="application/json", status_code=200)
+
+
+def _revoke_statement(hash_column):
+    """Build the revoking UPDATE for tokens matched on a single hash column."""
+    return (
+        update(OAuthToken)
+        .where(hash_column == bindparam("token_hash"))
+        .values(revoked=True)
+        .returning(
+            OAuthToken.user_id,
+            OAuthToken.access_token_hash,
+            OAuthToken.refresh_token_hash,
+            OAuthToken.access_token_jti,
+            OAuthToken.access_token_expires_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+# /revoke probes, built once; each hash column has its own unique index
+_REVOKE_BY_ACCESS_HASH = _revoke_statement(OAuthToken.access_token_hash)
+_REVOKE_BY_REFRESH_HASH = _revoke_statement(OAuthToken.refresh_token_hash)
+_REVOKE_ACCESS_FIRST = (_REVOKE_BY_ACCESS_HASH, _REVOKE_BY_REFRESH_HASH)
+_REVOKE_REFRESH_FIRST = (_REVOKE_BY_REFRESH_HASH, _REVOKE_BY_ACCESS_HASH)
 
 
 # OAuth 2.0 Protected Resource Metadata Endpoint
@@ -167,17 +351,12 @@ async def oauth_protected_resource_metadata():
 
     This is discovered by ChatGPT to locate the authorization server.
     """
-    resource = _normalize_base_url(settings.public_base_url)
-    issuer = _normalize_base_url(settings.oauth_issuer or settings.public_base_url)
-
-    metadata = OAuthProtectedResourceMetadataResponse(
-        resource=resource,
-        authorization_servers=[issuer],
-        scopes_supported=["tasks.read", "tasks.write", "offline_access"],
-    )
-
     logger.info("OAuth protected-resource metadata requested")
-    return metadata
+    return Response(
+        content=_PROTECTED_RESOURCE_METADATA,
+        media_type="application/json",
+        headers=_DISCOVERY_HEADERS,
+    )
 
 
 # OAuth 2.0 Authorization Server Metadata Endpoint
@@ -187,24 +366,12 @@ async def oauth_authorization_server_metadata():
     """
     OAuth 2.0 Authorization Server Metadata endpoint (RFC 8414).
     """
-    issuer = _normalize_base_url(settings.oauth_issuer or settings.public_base_url)
-
-    metadata = OAuthMetadataResponse(
-        issuer=issuer,
-        authorization_endpoint=f"{issuer}/authorize",
-        token_endpoint=f"{issuer}/token",
-        registration_endpoint=f"{issuer}/register",
-        revocation_endpoint=f"{issuer}/revoke",
-        jwks_uri=f"{issuer}/.well-known/jwks.json" if settings.jwt_algorithm.startswith("RS") else None,
-        response_types_supported=["code"],
-        grant_types_supported=["authorization_code", "refresh_token"],
-        token_endpoint_auth_methods_supported=["none"],  # PKCE public clients
-        code_challenge_methods_supported=["S256", "plain"],
-        scopes_supported=["tasks.read", "tasks.write", "offline_access"],
-    )
-
     logger.info("OAuth authorization-server metadata requested")
-    return metadata
+    return Response(
+        content=_AUTHORIZATION_SERVER_METADATA,
+        media_type="application/json",
+        headers=_DISCOVERY_HEADERS,
+    )
 
 
 # Authorization Endpoint
@@ -245,9 +412,8 @@ async def authorize(
         return oauth_error_response("invalid_client", "Unknown client_id", status_code=401)
 
     # Validate redirect_uri
-    allowed_uris = json.loads(client.redirect_uris)
-    if redirect_uri not in allowed_uris:
-        logger.warning(f"Invalid redirect_uri: {redirect_uri} not in {allowed_uris}")
+    if redirect_uri not in client.redirect_uris:
+        logger.warning(f"Invalid redirect_uri: {redirect_uri} not in {sorted(client.redirect_uris)}")
         return oauth_error_response("invalid_request", "Invalid redirect_uri")
 
     demo_username = None
@@ -262,10 +428,10 @@ async def authorize(
     # TODO: In production, render consent screen and get user approval
     # For now, we auto-create or get the mock/demo user
     oauth_sub = f"demo:{demo_username}" if demo_username else "chatgpt_user_mock"
-    result = await db.execute(select(User).where(User.oauth_sub == oauth_sub))
-    user = result.scalar_one_or_none()
+    result = await db.execute(select(User.id).where(User.oauth_sub == oauth_sub))
+    user_id = result.scalar_one_or_none()
 
-    if not user:
+    if user_id is None:
         # Create mock/demo user
         user = User(
             oauth_sub=oauth_sub,
@@ -273,36 +439,36 @@ async def authorize(
             name=demo_username or "ChatGPT User",
         )
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        logger.info(f"Created user: {user.id}")
+        # Flush for user.id; the user and the code below commit together
+        await db.flush()
+        user_id = user.id
+        logger.info(f"Created user: {user_id}")
 
     # Generate authorization code
-    auth_code = generate_random_string(32)
-    expires_at = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.authorization_code_expire_minutes
-    )
+    auth_code = generate_random_string(16)  # 128 bits, single-use and short-lived
 
     code_record = OAuthAuthorizationCode(
         code=auth_code,
         client_id=client.id,
-        user_id=user.id,
+        user_id=user_id,
         redirect_uri=redirect_uri,
         scope=scope,
         code_challenge=code_challenge,
         code_challenge_method=code_challenge_method,
-        expires_at=expires_at,
-        used="false",
+        expires_at=func.now() + _AUTHORIZATION_CODE_LIFETIME,
+        used=False,
     )
     db.add(code_record)
     await db.commit()
 
-    logger.info(f"Issued authorization code for user {user.id}, client {client_id}")
+    logger.info(f"Issued authorization code for user {user_id}, client {client_id}")
 
     # Redirect back to client with code and state
-    redirect_url = f"{redirect_uri}?code={auth_code}"
+    params = [("code", auth_code)]
     if state:
-        redirect_url += f"&state={state}"
+        params.append(("state", state))
+    separator = "&" if "?" in redirect_uri else "?"
+    redirect_url = f"{redirect_uri}{separator}{urlencode(params)}"
 
     return RedirectResponse(url=redirect_url, status_code=302)
 
@@ -320,7 +486,7 @@ async def login(
     if username != settings.demo_username or password != settings.demo_password:
         return HTMLResponse(content=_login_page(safe_return_url, error="Invalid username or password."), status_code=401)
 
-    token = _create_demo_session_token(username)
+    token = await run_token_signing(_create_demo_session_token, username)
     response = RedirectResponse(url=safe_return_url, status_code=302)
     secure_cookie = settings.public_base_url.startswith("https://")
     response.set_cookie(
@@ -375,101 +541,137 @@ async def token(
                 "code, redirect_uri, and code_verifier are required for authorization_code grant",
             )
 
-        # Get authorization code
-        result = await db.execute(
-            select(OAuthAuthorizationCode).where(OAuthAuthorizationCode.code == code)
-        )
-        code_record = result.scalar_one_or_none()
-
-        if not code_record:
-            return oauth_error_response("invalid_grant", "Invalid authorization code")
-
-        # Validate code
-        if code_record.used == "true":
-            logger.warning(f"Authorization code already used: {code}")
-            return oauth_error_response("invalid_grant", "Authorization code already used")
-
-        if code_record.is_expired:
-            logger.warning(f"Authorization code expired: {code}")
-            return oauth_error_response("invalid_grant", "Authorization code expired")
-
-        if code_record.redirect_uri != redirect_uri:
-            logger.warning(f"redirect_uri mismatch: {redirect_uri} != {code_record.redirect_uri}")
-            return oauth_error_response("invalid_grant", "redirect_uri mismatch")
-
-        # Verify PKCE
-        if not verify_pkce_challenge(
-            code_verifier, code_record.code_challenge, code_record.code_challenge_method
-        ):
-            logger.warning("PKCE verification failed")
-            return oauth_error_response("invalid_grant", "Invalid code_verifier")
-
-        # Mark code as used
-        code_record.used = "true"
-
-        # Create tokens
-        user_id = code_record.user_id
-        scope = code_record.scope
-        access_token_str, access_token_expires = create_access_token(
-            user_id, client.client_id, scope
-        )
-        refresh_token_str, refresh_token_expires = create_refresh_token(
-            user_id, client.client_id, scope
-        )
-
-        access_token_hash = hash_token(access_token_str)
-        refresh_token_hash = hash_token(refresh_token_str)
-
-        # Store tokens in database
-        token_record = OAuthToken(
-            access_token=access_token_str,
-            refresh_token=refresh_token_str,
-            access_token_hash=access_token_hash,
-            refresh_token_hash=refresh_token_hash,
-            token_type="Bearer",
-            client_id=client.id,
-            user_id=user_id,
-            scope=scope,
-            access_token_expires_at=access_token_expires,
-            refresh_token_expires_at=refresh_token_expires,
-            revoked="false",
-        )
-        db.add(token_record)
-        await db.commit()
-
-        logger.info(f"Issued tokens for user {user_id}, client {client_id}")
+        # Single-flight per code: a duplicate exchange arriving while the
+        # first is still in progress is refused here instead of queueing on
+        # the code's row lock, only to find it used once the winner commits.
+        if code in _codes_in_flight:
+            logger.warning(f"Concurrent exchange of authorization code rejected: {code}")
+            return oauth_error_response(
+                "invalid_grant", "Invalid, expired or already used authorization code"
+            )
+        _codes_in_flight.add(code)
+        try:
+            # Consume the code atomically: of several concurrent exchanges of the
+            # same code only one gets a row back, so a code can never be replayed.
+            result = await db.execute(
+                update(OAuthAuthorizationCode)
+                .where(
+                    OAuthAuthorizationCode.code == code,
+                    OAuthAuthorizationCode.client_id == client.id,
+                    OAuthAuthorizationCode.used.is_(False),
+                    OAuthAuthorizationCode.expires_at > func.now(),
+                )
+                .values(used=True)
+                .returning(
+                    OAuthAuthorizationCode.user_id,
+                    OAuthAuthorizationCode.redirect_uri,
+                    OAuthAuthorizationCode.scope,
+                    OAuthAuthorizationCode.code_challenge,
+                    OAuthAuthorizationCode.code_challenge_method,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            code_record = result.one_or_none()
+
+            if not code_record:
+                logger.warning(f"Authorization code invalid, expired or already used: {code}")
+                return oauth_error_response(
+                    "invalid_grant", "Invalid, expired or already used authorization code"
+                )
+
+            # A failed exchange still spends the code: commit its used flag
+            if code_record.redirect_uri != redirect_uri:
+                logger.warning(f"redirect_uri mismatch: {redirect_uri} != {code_record.redirect_uri}")
+                await db.commit()
+                return oauth_error_response("invalid_grant", "redirect_uri mismatch")
+
+            # Verify PKCE
+            if not verify_pkce_challenge(
+                code_verifier, code_record.code_challenge, code_record.code_challenge_method
+            ):
+                logger.warning("PKCE verification failed")
+                await db.commit()
+                return oauth_error_response("invalid_grant", "Invalid code_verifier")
+
+            # Create tokens
+            user_id = code_record.user_id
+            scope = code_record.scope
+            access_token_jti = str(uuid.uuid4())
+            (
+                access_token_str,
+                access_token_expires,
+                refresh_token_str,
+                refresh_token_expires,
+            ) = await run_token_signing(
+                create_token_pair, user_id, client.client_id, scope, jti=access_token_jti
+            )
 
-        return TokenResponse(
-            access_token=access_token_str,
-            token_type="Bearer",
-            expires_in=settings.access_token_expire_minutes * 60,
-            refresh_token=refresh_token_str,
-            scope=scope,
-        )
+            access_token_hash = hash_token(access_token_str)
+            refresh_token_hash = hash_token(refresh_token_str)
+
+            # Store tokens in database
+            token_record = OAuthToken(
+                access_token_hash=access_token_hash,
+                refresh_token_hash=refresh_token_hash,
+                access_token_jti=access_token_jti,
+                token_type="Bearer",
+                client_id=client.id,
+                user_id=user_id,
+                scope=scope,
+                access_token_expires_at=access_token_expires,
+                refresh_token_expires_at=refresh_token_expires,
+                revoked=False,
+            )
+            db.add(token_record)
+            await db.commit()
+            cache_issued_token(access_token_hash, access_token_expires.timestamp())
+
+            logger.info(f"Issued tokens for user {user_id}, client {client_id}")
+
+            # Returned as-is: FastAPI skips re-validating against response_model,
+            # which only documents the shape
+            return ORJSONResponse(
+                content={
+                    "access_token": access_token_str,
+                    "token_type": "Bearer",
+                    "expires_in": settings.access_token_expire_minutes * 60,
+                    "refresh_token": refresh_token_str,
+                    "scope": scope,
+                }
+            )
+        finally:
+            _codes_in_flight.discard(code)
 
     # Handle refresh_token grant
     elif grant_type == "refresh_token":
         if not refresh_token:
             return oauth_error_response("invalid_request", "refresh_token is required")
 
-        # Verify refresh token
-        try:
-            payload = verify_token(refresh_token, expected_token_type="refresh_token")
-        except Exception as e:
-            logger.warning(f"Invalid refresh token: {e}")
-            return oauth_error_response("invalid_grant", "Invalid refresh token")
+        # Hash once: the same value is used for every lookup below
+        refresh_token_hash = hash_token(refresh_token)
+
+        # Verify refresh token (reusing a recent verification when available)
+        payload = _verified_refresh_cache.get(refresh_token_hash)
+        if payload is None or payload["exp"] <= time.time():
+            try:
+                payload = verify_token(refresh_token, expected_token_type="refresh_token")
+            except Exception as e:
+                logger.warning(f"Invalid refresh token: {e}")
+                return oauth_error_response("invalid_grant", "Invalid refresh token")
+
+            if not payload:
+                return oauth_error_response("invalid_grant", "Invalid refresh token")
 
-        if not payload:
-            return oauth_error_response("invalid_grant", "Invalid refresh token")
+            if "exp" in payload:
+                _verified_refresh_cache[refresh_token_hash] = payload
 
         # Get token from database
-        refresh_token_hash = hash_token(refresh_token)
         result = await db.execute(
             select(OAuthToken).where(OAuthToken.refresh_token_hash == refresh_token_hash)
         )
         token_record = result.scalar_one_or_none()
 
-        if not token_record or token_record.revoked == "true":
+        if not token_record or token_record.revoked:
             return oauth_error_response("invalid_grant", "Token revoked or not found")
 
         if token_record.is_refresh_token_expired:
@@ -478,24 +680,36 @@ async def token(
         # Create new access token
         user_id = token_record.user_id
         scope = token_record.scope
-        new_access_token, new_access_expires = create_access_token(
-            user_id, client.client_id, scope
+        new_access_jti = str(uuid.uuid4())
+        new_access_token, new_access_expires = await run_token_signing(
+            create_access_token, user_id, client.client_id, scope, jti=new_access_jti
         )
 
-        # Update token record
-        token_record.access_token = new_access_token
-        token_record.access_token_hash = hash_token(new_access_token)
+        # Update token record; the superseded access token is revoked everywhere
+        old_access_jti = token_record.access_token_jti
+        old_access_expires = token_record.access_token_expires_at.timestamp()
+        if old_access_jti:
+            await publish_jti_revoked(db, old_access_jti, old_access_expires)
+        invalidate_cached_token(token_record.access_token_hash)
+        new_access_hash = hash_token(new_access_token)
+        token_record.access_token_hash = new_access_hash
+        token_record.access_token_jti = new_access_jti
         token_record.access_token_expires_at = new_access_expires
         await db.commit()
+        cache_issued_token(new_access_hash, new_access_expires.timestamp())
+        if old_access_jti:
+            mark_jti_revoked(old_access_jti, old_access_expires)
 
         logger.info(f"Refreshed access token for user {user_id}")
 
-        return TokenResponse(
-            access_token=new_access_token,
-            token_type="Bearer",
-            expires_in=settings.access_token_expire_minutes * 60,
-            refresh_token=refresh_token,  # Return same refresh token
-            scope=scope,
+        return ORJSONResponse(
+            content={
+                "access_token": new_access_token,
+                "token_type": "Bearer",
+                "expires_in": settings.access_token_expire_minutes * 60,
+                "refresh_token": refresh_token,  # Return same refresh token
+                "scope": scope,
+            }
         )
 
 
@@ -509,23 +723,34 @@ async def revoke(
     """
     OAuth 2.0 token revocation endpoint (RFC 7009).
     """
-    # Find token in database (check both access_token and refresh_token)
+    # Probe the hash column named by token_type_hint first and fall back to the
+    # other one (RFC 7009 2.1), so a correct hint costs a single index lookup.
     token_hash = hash_token(token)
-    result = await db.execute(
-        select(OAuthToken).where(
-            (OAuthToken.access_token_hash == token_hash)
-            | (OAuthToken.refresh_token_hash == token_hash)
-        )
+    lookup_order = (
+        _REVOKE_REFRESH_FIRST if token_type_hint == "refresh_token" else _REVOKE_ACCESS_FIRST
     )
-    token_record = result.scalar_one_or_none()
-
-    if token_record:
-        token_record.revoked = "true"
+    revoked_row = None
+    for statement in lookup_order:
+        result = await db.execute(statement, {"token_hash": token_hash})
+        revoked_row = result.one_or_none()
+        if revoked_row:
+            break
+
+    if revoked_row:
+        access_jti = revoked_row.access_token_jti
+        access_expires = revoked_row.access_token_expires_at.timestamp()
+        if access_jti:
+            await publish_jti_revoked(db, access_jti, access_expires)
         await db.commit()
-        logger.info(f"Revoked token for user {token_record.user_id}")
+        invalidate_cached_token(revoked_row.access_token_hash)
+        if revoked_row.refresh_token_hash:
+            _verified_refresh_cache.pop(revoked_row.refresh_token_hash, None)
+        if access_jti:
+            mark_jti_revoked(access_jti, access_expires)
+        logger.info(f"Revoked token for user {revoked_row.user_id}")
 
     # Per RFC 7009, return 200 OK even if token doesn't exist
-    return JSONResponse(content={}, status_code=200)
+    return _REVOKE_OK
 
 
 # Client Registration Endpoint (Dynamic Client Registration)
@@ -540,53 +765,58 @@ async def register_client(
     Allows ChatGPT to register as an OAuth client.
     """
     # Generate client_id
-    client_id = f"chatgpt_{generate_random_string(16)}"
+    client_id = f"chatgpt_{generate_random_string(12)}"
 
     # Create OAuth client
     client = OAuthClient(
         client_id=client_id,
         client_name=request.client_name,
         client_uri=request.client_uri,
-        redirect_uris=json.dumps(request.redirect_uris),
-        grant_types=json.dumps(request.grant_types),
-        response_types=json.dumps(request.response_types),
+        redirect_uris=request.redirect_uris,
+        grant_types=request.grant_types,
+        response_types=request.response_types,
         scope=request.scope,
         token_endpoint_auth_method=request.token_endpoint_auth_method,
     )
     db.add(client)
+    # id and created_at are Python-side defaults and the session does not
+    # expire on commit, so the response is built without re-selecting the row
     await db.commit()
-    await db.refresh(client)
+    _client_cache.pop(client_id, None)
 
     logger.info(f"Registered new OAuth client: {client_id}")
 
-    return ClientRegistrationResponse(
-        client_id=client.client_id,
-        client_name=client.client_name,
-        client_uri=client.client_uri,
-        redirect_uris=json.loads(client.redirect_uris),
-        grant_types=json.loads(client.grant_types),
-        response_types=json.loads(client.response_types),
-        scope=client.scope,
-        token_endpoint_auth_method=client.token_endpoint_auth_method,
-        client_id_issued_at=int(client.created_at.timestamp()),
+    # The request body was already validated; skip response_model re-validation
+    return ORJSONResponse(
+        content={
+            "client_id": client.client_id,
+            "client_name": client.client_name,
+            "client_uri": client.client_uri,
+            "redirect_uris": client.redirect_uris,
+            "grant_types": client.grant_types,
+            "response_types": client.response_types,
+            "scope": client.scope,
+            "token_endpoint_auth_method": client.token_endpoint_auth_method,
+            "client_id_issued_at": int(client.created_at.timestamp()),
+        }
     )
 
 
-# JWKS Endpoint (for RS256)
+# JWKS Endpoint (for RS256/ES256/EdDSA)
 @router.get("/.well-known/jwks.json", response_model=JWKSet)
 async def jwks():
     """
-    JSON Web Key Set endpoint (for RS256 signature verification).
+    JSON Web Key Set endpoint (for asymmetric signature verification).
 
-    Only needed if using RS256. For HS256, ChatGPT won't call this.
+    Only needed if using RS*/ES*/EdDSA. For HS256, ChatGPT won't call this.
     """
-    if not settings.jwt_algorithm.startswith("RS"):
+    if not is_asymmetric_algorithm(settings.jwt_algorithm):
         raise HTTPException(
             status_code=404,
-            detail="JWKS endpoint only available when using RS256/RS384/RS512",
+            detail="JWKS endpoint only available when using RS*, ES* or EdDSA",
         )
 
     # TODO: Implement JWKS key extraction from RSA public key
     # For now, return empty key set
     logger.warning("JWKS endpoint not fully implemented - returning empty key set")
-    return JWKSet(keys=[])
+    return Response(content=_EMPTY_JWKS, media_type="application/json", headers=_DISCOVERY_HEADERS)
@@ -8,17 +8,20 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-def generate_random_string(length: int = 32) -> str:
+def generate_random_string(nbytes: int = 16) -> str:
     """
     Generate a cryptographically secure random string.
 
+    Draws all entropy in one os.urandom call and base64url-encodes it in C.
+
     Args:
-        length: Length of the random string (default: 32 characters)
+        nbytes: Number of random bytes (default: 16, i.e. 128 bits); the
+            result is about 4/3 as many characters (22 for 16 bytes)
 
     Returns:
         URL-safe random string
     """
-    return secrets.token_urlsafe(length)
+    return secrets.token_urlsafe(nbytes)
 
 
 def _base64_url_encode(data: bytes) -> str:
@@ -34,6 +37,22 @@ def _base64_url_encode(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
 
 
+def _base64_url_decode(data: str) -> bytes:
+    """
+    Decode Base64 URL-safe data without '=' padding.
+
+    Args:
+        data: Base64 URL-safe string, padded or not
+
+    Returns:
+        Decoded bytes
+
+    Raises:
+        ValueError: If data is not valid base64
+    """
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
 def compute_code_challenge(code_verifier: str, method: str = "S256") -> str:
     """
     Compute PKCE code challenge from code verifier.
@@ -88,11 +107,17 @@ def verify_pkce_challenge(
             logger.warning(f"Invalid code_verifier length: {len(code_verifier)} (must be 43-128)")
             return False
 
-        # Compute expected challenge from verifier
-        computed_challenge = compute_code_challenge(code_verifier, code_challenge_method)
-
         # Constant-time comparison to prevent timing attacks
-        is_valid = secrets.compare_digest(computed_challenge, code_challenge)
+        if code_challenge_method == "S256":
+            # Compare raw 32-byte digests instead of re-encoding ours; an S256
+            # challenge is always 43 base64url characters
+            digest = hashlib.sha256(code_verifier.encode("utf-8")).digest()
+            is_valid = len(code_challenge) == 43 and secrets.compare_digest(
+                digest, _base64_url_decode(code_challenge)
+            )
+        else:
+            computed_challenge = compute_code_challenge(code_verifier, code_challenge_method)
+            is_valid = secrets.compare_digest(computed_challenge, code_challenge)
 
         if is_valid:
             logger.info("PKCE verification successful")
@@ -0,0 +1,171 @@
+"""In-memory revocation list for access tokens, keyed by JWT ID (jti).
+
+OAuthMiddleware rejects revoked tokens from this list without a database
+round-trip. The list is filled from the database at startup and kept in
+sync across worker processes with PostgreSQL LISTEN/NOTIFY.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Optional
+
+from cachetools import TLRUCache
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..database import AsyncSessionLocal, engine
+from ..models.database import OAuthToken
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+REVOCATION_CHANNEL = "revoked_tokens"
+
+# Delay before re-establishing a lost LISTEN connection, doubling per failed
+# attempt up to the maximum.
+_RECONNECT_DELAY_SECONDS = 1.0
+_MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+
+def _revoked_jti_ttu(_jti: str, expires_at: float, _now: float) -> float:
+    """Forget a revoked jti once the token it belongs to has expired anyway."""
+    return expires_at
+
+
+# Revoked jti -> access token expiry (unix timestamp)
+_revoked_jtis: TLRUCache = TLRUCache(
+    maxsize=settings.token_cache_max_size,
+    ttu=_revoked_jti_ttu,
+    timer=time.time,
+)
+
+
+def is_jti_revoked(jti: Optional[str]) -> bool:
+    """Check whether an access token's jti has been revoked."""
+    return jti is not None and jti in _revoked_jtis
+
+
+def mark_jti_revoked(jti: str, expires_at: float) -> None:
+    """Add a jti to this process's revocation list until the token expires."""
+    if expires_at > time.time():
+        _revoked_jtis[jti] = expires_at
+
+
+async def publish_jti_revoked(db: AsyncSession, jti: str, expires_at: float) -> None:
+    """Notify other workers of a revocation; delivered when the transaction commits."""
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": REVOCATION_CHANNEL, "payload": f"{jti}:{int(expires_at)}"},
+    )
+
+
+async def load_revoked_jtis() -> int:
+    """Fill the revocation list with revoked, unexpired access tokens from the database."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(OAuthToken.access_token_jti, OAuthToken.access_token_expires_at).where(
+                OAuthToken.revoked.is_(True),
+                OAuthToken.access_token_jti.is_not(None),
+                OAuthToken.access_token_expires_at > func.now(),
+            )
+        )
+        rows = result.all()
+
+    for jti, expires_at in rows:
+        mark_jti_revoked(jti, expires_at.timestamp())
+    return len(rows)
+
+
+def _on_revocation_notification(_connection: Any, _pid: int, _channel: str, payload: str) -> None:
+    """Apply a "jti:expires_at" revocation notification from another worker."""
+    jti, _, expires_at = payload.rpartition(":")
+    try:
+        mark_jti_revoked(jti, float(expires_at))
+    except ValueError:
+        logger.warning(f"Ignoring malformed revocation notification: {payload[:80]}")
+
+
+async def _listen_for_revocations() -> None:
+    """
+    Hold a connection LISTENing on REVOCATION_CHANNEL until cancelled.
+
+    When the connection is lost (database restart, idle timeout, failover) it
+    is discarded and re-established with backoff. Notifications sent while
+    disconnected are never delivered, so the revocation list is reloaded from
+    the database after every reconnect.
+    """
+    delay = _RECONNECT_DELAY_SECONDS
+    reconnecting = False
+    while True:
+        try:
+            async with engine.connect() as connection:
+                raw_connection = await connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                lost = asyncio.Event()
+
+                def on_termination(_conn: Any) -> None:
+                    lost.set()
+
+                driver_connection.add_termination_listener(on_termination)
+                await driver_connection.add_listener(
+                    REVOCATION_CHANNEL, _on_revocation_notification
+                )
+                try:
+                    if reconnecting:
+                        count = await load_revoked_jtis()
+                        logger.info(f"Reloaded {count} revoked access tokens after reconnecting")
+                    logger.info(f"Listening for token revocations on '{REVOCATION_CHANNEL}'")
+                    reconnecting = True
+                    delay = _RECONNECT_DELAY_SECONDS
+                    await lost.wait()
+                finally:
+                    if lost.is_set():
+                        # Don't hand the dead connection back to the pool
+                        await connection.invalidate()
+                    else:
+                        driver_connection.remove_termination_listener(on_termination)
+                        await driver_connection.remove_listener(
+                            REVOCATION_CHANNEL, _on_revocation_notification
+                        )
+            logger.warning("Revocation LISTEN connection lost, reconnecting")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            reconnecting = True
+            logger.error(f"Failed to listen for token revocations: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _MAX_RECONNECT_DELAY_SECONDS)
+
+
+@contextlib.asynccontextmanager
+async def sync_revocations() -> AsyncIterator[None]:
+    """
+    Keep the revocation list in sync for the lifetime of the app.
+
+    Loads existing revocations, then runs a background task that LISTENs on
+    REVOCATION_CHANNEL and reconnects (reloading the list) if the connection
+    drops. If the database is unavailable the middleware still falls back to
+    its per-token database check, so startup continues.
+    """
+    try:
+        count = await load_revoked_jtis()
+        logger.info(f"Loaded {count} revoked access tokens")
+    except Exception as e:
+        logger.error(f"Failed to load revoked access tokens: {e}")
+
+    if settings.database_pgbouncer:
+        # LISTEN needs a dedicated server session, which transaction pooling
+        # does not provide; the per-token status check still catches revocations.
+        logger.info("Skipping revocation LISTEN behind PgBouncer")
+        yield
+        return
+
+    listener = asyncio.create_task(_listen_for_revocations())
+    try:
+        yield
+    finally:
+        listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
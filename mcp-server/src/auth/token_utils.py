@@ -3,6 +3,6 @@
 import hashlib
 
 
-def hash_token(token: str) -> str:
-    """Return a SHA-256 hex digest for the token."""
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+def hash_token(token: str) -> bytes:
+    """Return the SHA-256 digest stored for the token (32 raw bytes)."""
+    return hashlib.sha256(token.encode("utf-8")).digest()
@@ -4,8 +4,10 @@ This module provides async database connectivity using SQLAlchemy 2.0+.
 """
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 from ..config import settings
 from ..utils.logging import get_logger
 
@@ -14,11 +16,30 @@ logger = get_logger(__name__)
 # Create declarative base for models
 Base = declarative_base()
 
+if settings.database_pgbouncer:
+    # PgBouncer (transaction pooling) multiplexes server connections, so keep no
+    # local pool, and give prepared statements unique names: consecutive
+    # transactions may land on different server connections.
+    _pool_options: dict[str, Any] = {
+        "poolclass": NullPool,
+        "connect_args": {"prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"},
+    }
+else:
+    _pool_options = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+        # Reuse the most recently returned connection: a small warm set serves
+        # normal load and the rest of the pool idles until pool_recycle retires it
+        "pool_use_lifo": True,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
+    **_pool_options,
     echo=settings.debug,  # Log SQL queries in debug mode
     future=True,
 )
@@ -36,12 +57,16 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session.
 
+    Nothing is committed on exit: handlers that write call ``await db.commit()``
+    themselves, so read-only requests never pay for a COMMIT round-trip.
+
     Yields:
         AsyncSession: Database session
 
     Example:
         ```python
-        async with get_db() as db:
+        @router.get("/items")
+        async def list_items(db: AsyncSession = Depends(get_db)):
             result = await db.execute(select(User))
             users = result.scalars().all()
         ```
@@ -50,8 +75,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             logger.debug("Database session created")
             yield session
-            await session.commit()
-            logger.debug("Database session committed")
         except Exception as e:
             await session.rollback()
             logger.error(f"Database session rolled back due to error: {e}")
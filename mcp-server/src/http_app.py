@@ -8,31 +8,27 @@ import json
 from typing import Any, Literal
 from urllib.parse import urlparse
 
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
 from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import Resource as MCPResource
+from mcp.types import Tool as MCPTool
 import mcp.types as mcp_types
 from mcp.types import CallToolResult, TextContent, ToolAnnotations
 from mcp.server.transport_security import TransportSecuritySettings
 
 from .config import settings
-from .tools.integrations import trigger_integration_tool
 from .tools.tasks import create_task_tool, list_tasks_tool, update_task_status_tool
 from .utils.logging import get_logger, setup_logging
 from .auth.oauth_routes import router as oauth_router
+from .auth import preload_keys
 from .auth.middleware import OAuthMiddleware
-
-setup_logging(
-    log_level=settings.log_level,
-    log_format=settings.log_format,
-    log_output=settings.log_output,
-    log_file_path=settings.log_file_path,
-    log_max_bytes=settings.log_max_bytes,
-    log_backup_count=settings.log_backup_count,
-)
+from .auth.revocation import sync_revocations
 
 logger = get_logger(__name__)
 
@@ -56,23 +52,29 @@ def _tool_annotations(read_only: bool, open_world: bool, destructive: bool) -> T
         destructiveHint=destructive,
     )
 
+
+# Tools returning this are annotated "-> CallToolResult", so FastMCP hands the
+# result through as-is instead of re-validating structuredContent on every call.
 def _tool_response(result: dict[str, Any], view: str) -> CallToolResult:
     message = result.get("message") or result.get("error") or "Request completed."
+    # Tool results always carry their data as a dict
     data = result.get("data") or {}
+    success = result.get("success", False)
     structured_content: dict[str, Any] = {
-        "success": result.get("success", False),
+        "success": success,
         "message": message,
         "view": view,
         "payload": data,
     }
 
-    if "count" in data and isinstance(data["count"], int):
-        structured_content["count"] = data["count"]
-    elif isinstance(data, dict) and isinstance(data.get("tasks"), list):
-        structured_content["count"] = len(data["tasks"])
-    if isinstance(data, dict) and "id" in data:
+    count = data.get("count")
+    if isinstance(count, int):
+        structured_content["count"] = count
+    elif isinstance(tasks := data.get("tasks"), list):
+        structured_content["count"] = len(tasks)
+    if "id" in data:
         structured_content["id"] = data["id"]
-    if not structured_content["success"] and "error" in result:
+    if not success and "error" in result:
         structured_content["error"] = result["error"]
 
     return CallToolResult(
@@ -88,6 +90,149 @@ def _tool_response(result: dict[str, Any], view: str) -> CallToolResult:
 
 
 UI_TEMPLATE_URI = "ui://widget/tasks.html"
+WIDGET_MIME_TYPE = "text/html+skybridge"
+
+# Tool metadata and annotations are fixed; built once and shared by every create_app() call
+_CREATE_TASK_META = _tool_meta(UI_TEMPLATE_URI, "Creating task…", "Task created.")
+_LIST_TASKS_META = _tool_meta(UI_TEMPLATE_URI, "Fetching tasks…", "Tasks ready.")
+_UPDATE_TASK_STATUS_META = _tool_meta(UI_TEMPLATE_URI, "Updating task…", "Task updated.")
+_TRIGGER_INTEGRATION_META = _tool_meta(
+    UI_TEMPLATE_URI, "Triggering integration…", "Integration triggered."
+)
+_GENERATE_REPORT_META = _tool_meta(UI_TEMPLATE_URI, "Generating report…", "Report ready.")
+_SCHEDULE_WORKFLOW_META = _tool_meta(UI_TEMPLATE_URI, "Scheduling workflow…", "Workflow scheduled.")
+_WRITE_ANNOTATIONS = _tool_annotations(read_only=False, open_world=False, destructive=False)
+_READ_ONLY_ANNOTATIONS = _tool_annotations(read_only=True, open_world=False, destructive=False)
+_OPEN_WORLD_ANNOTATIONS = _tool_annotations(read_only=False, open_world=True, destructive=False)
+
+
+def _placeholder_result(message: str, view: str) -> CallToolResult:
+    """Build the fixed result of a tool that is not implemented yet."""
+    payload = {
+        "structuredContent": {"success": False, "message": message},
+        "content": [{"type": "text", "text": message}],
+        "_meta": {"ui": {"view": view}},
+    }
+    # Same shape FastMCP produced from the returned dict: the payload as
+    # structured content plus its indented JSON as the text block.
+    return CallToolResult(
+        content=[TextContent(type="text", text=json.dumps(payload, indent=2))],
+        structuredContent=payload,
+    )
+
+
+# Phase 2 tools answer with a constant result, built once
+_GENERATE_REPORT_RESULT = _placeholder_result(
+    "Report generation will be available in Phase 2", "report_placeholder"
+)
+_SCHEDULE_WORKFLOW_RESULT = _placeholder_result(
+    "Workflow scheduling will be available in Phase 2", "workflow_placeholder"
+)
+
+
+# Widget markup served for UI_TEMPLATE_URI; constant for the life of the process
+TASKS_WIDGET_HTML = """
+<!doctype html>
+<html lang=\"en\">
+  <head>
+    <meta charset=\"utf-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+    <style>
+      body {
+        font-family: ui-sans-serif, system-ui, -apple-system, sans-serif;
+        margin: 0;
+        padding: 16px;
+      }
+      .summary { font-weight: 600; margin-bottom: 12px; }
+      table { width: 100%; border-collapse: collapse; }
+      th, td { text-align: left; padding: 8px; border-bottom: 1px solid #e5e7eb; }
+      .badge {
+        display: inline-block;
+        padding: 2px 8px;
+        border-radius: 12px;
+        font-size: 12px;
+        background: #eef2ff;
+      }
+      .empty { color: #6b7280; }
+    </style>
+  </head>
+  <body>
+    <div id=\"root\"></div>
+    <script>
+      const root = document.getElementById("root");
+      const meta = window.openai?.toolResponseMetadata || {};
+      let output = window.openai?.toolOutput || {};
+
+      const tryParse = (value) => {
+        if (typeof value !== "string") return value;
+        try {
+          return JSON.parse(value);
+        } catch (err) {
+          return value;
+        }
+      };
+
+      output = tryParse(output);
+      output.result = tryParse(output.result);
+
+      const payload =
+        output.payload ||
+        output.data ||
+        output.result?.payload ||
+        output.result?.data ||
+        meta.ui?.payload ||
+        {};
+
+      const tasks =
+        payload.tasks ||
+        output.tasks ||
+        output.result?.tasks ||
+        [];
+
+      const message = output.message || payload.message || "Tasks";
+
+      root.innerHTML = "";
+      const summary = document.createElement("div");
+      summary.className = "summary";
+      summary.textContent = message;
+      root.appendChild(summary);
+
+      if (!tasks.length) {
+        const empty = document.createElement("div");
+        empty.className = "empty";
+        empty.textContent = "No tasks to display.";
+        root.appendChild(empty);
+      } else {
+        const table = document.createElement("table");
+        table.innerHTML = `
+          <thead>
+            <tr>
+              <th>Title</th>
+              <th>Status</th>
+              <th>Priority</th>
+              <th>Due</th>
+            </tr>
+          </thead>
+          <tbody>
+            ${tasks
+              .map(
+                (task) => `
+              <tr>
+                <td>${task.title}</td>
+                <td><span class=\"badge\">${task.status}</span></td>
+                <td>${task.priority || ""}</td>
+                <td>${task.due_date || ""}</td>
+              </tr>`
+              )
+              .join("")}
+          </tbody>
+        `;
+        root.appendChild(table);
+      }
+    </script>
+  </body>
+</html>
+""".strip()
 
 
 def _origin_from_base_url(base_url: str) -> str | None:
@@ -102,12 +247,11 @@ def _origin_from_base_url(base_url: str) -> str | None:
 def _user_id_from_context(ctx: Context | None) -> str:
     if not ctx:
         return MOCK_USER_ID
-    request = getattr(ctx.request_context, "request", None)
-    if request and hasattr(request, "state"):
-        user_id = getattr(request.state, "user_id", None)
-        if user_id:
-            return str(user_id)
-    return MOCK_USER_ID
+    request = ctx.request_context.request
+    if request is None:
+        return MOCK_USER_ID
+    user_id = getattr(request.state, "user_id", None)
+    return str(user_id) if user_id else MOCK_USER_ID
 
 
 def _widget_meta() -> dict[str, Any]:
@@ -125,50 +269,133 @@ def _widget_meta() -> dict[str, Any]:
     }
 
 
+# Built once: PUBLIC_BASE_URL is parsed at import, not on every resource request
+_WIDGET_META = _widget_meta()
+
+
 class WidgetFastMCP(FastMCP):
+    # Tool and resource listings only change when something is registered, so
+    # each is built once and reused until the next registration.
+    _tools_listing: list[MCPTool] | None = None
+    _resources_listing: list[MCPResource] | None = None
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        self._tools_listing = None
+        super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, name: str) -> None:
+        self._tools_listing = None
+        super().remove_tool(name)
+
+    def add_resource(self, resource: Any) -> None:
+        self._resources_listing = None
+        super().add_resource(resource)
+
+    async def list_tools(self) -> list[MCPTool]:
+        if self._tools_listing is None:
+            self._tools_listing = await super().list_tools()
+        return self._tools_listing
+
     async def list_resources(self) -> list[MCPResource]:
-        resources = await super().list_resources()
-        widget_meta = _widget_meta()
-        updated: list[MCPResource] = []
-        for resource in resources:
-            if str(resource.uri) == UI_TEMPLATE_URI:
-                updated.append(resource.model_copy(update={"meta": widget_meta}))
-            else:
-                updated.append(resource)
-        return updated
+        if self._resources_listing is None:
+            resources = await super().list_resources()
+            updated: list[MCPResource] = []
+            for resource in resources:
+                if str(resource.uri) == UI_TEMPLATE_URI:
+                    updated.append(resource.model_copy(update={"meta": _WIDGET_META}))
+                else:
+                    updated.append(resource)
+            self._resources_listing = updated
+        return self._resources_listing
 
 
 def _register_widget_read_resource_handler(mcp: WidgetFastMCP) -> None:
+    # The widget is static, so its read result is built once and reused
+    widget_result = mcp_types.ServerResult(
+        mcp_types.ReadResourceResult(
+            contents=[
+                mcp_types.TextResourceContents(
+                    uri=UI_TEMPLATE_URI,
+                    text=TASKS_WIDGET_HTML,
+                    mimeType=WIDGET_MIME_TYPE,
+                    meta=_WIDGET_META,
+                )
+            ]
+        )
+    )
+
     async def handler(req: mcp_types.ReadResourceRequest):
+        if str(req.params.uri) == UI_TEMPLATE_URI:
+            return widget_result
+
         context = mcp.get_context()
         resource = await mcp._resource_manager.get_resource(req.params.uri, context=context)
         content = await resource.read()
-        meta = _widget_meta() if str(resource.uri) == UI_TEMPLATE_URI else None
 
         if isinstance(content, bytes):  # pragma: no cover
             blob = mcp_types.BlobResourceContents(
                 uri=req.params.uri,
                 blob=base64.b64encode(content).decode(),
                 mimeType=resource.mime_type,
-                meta=meta,
             )
             return mcp_types.ServerResult(mcp_types.ReadResourceResult(contents=[blob]))
         if not isinstance(content, str):
-            content = json.dumps(content, default=str)
+            content = orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
         text = mcp_types.TextResourceContents(
             uri=req.params.uri,
             text=content,
             mimeType=resource.mime_type,
-            meta=meta,
         )
         return mcp_types.ServerResult(mcp_types.ReadResourceResult(contents=[text]))
 
     mcp._mcp_server.request_handlers[mcp_types.ReadResourceRequest] = handler
 
 
+# Browser-facing OAuth pages and discovery documents accept any origin
+ORIGIN_EXEMPT_PREFIXES = ("/login", "/authorize", "/.well-known/")
+
+
+class OriginValidationMiddleware:
+    """
+    Reject HTTP requests whose Origin header is not an allowed origin.
+
+    Plain ASGI rather than @app.middleware("http"), so allowed requests are
+    passed straight through without BaseHTTPMiddleware's request/response
+    wrapping.
+    """
+
+    def __init__(self, app: ASGIApp, allowed_origins: frozenset[str]):
+        self.app = app
+        self.allowed_origins = allowed_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not scope["path"].startswith(ORIGIN_EXEMPT_PREFIXES):
+            origin = Headers(scope=scope).get("origin")
+            if origin and origin not in self.allowed_origins:
+                logger.warning(
+                    "Blocked request with disallowed origin",
+                    extra={"extra_fields": {"origin": origin, "path": scope["path"]}},
+                )
+                response = ORJSONResponse(status_code=403, content={"error": "Origin not allowed"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
 def create_app() -> FastAPI:
+    # Configured here rather than at import, so importing this module has no side effects
+    setup_logging(
+        log_level=settings.log_level,
+        log_format=settings.log_format,
+        log_output=settings.log_output,
+        log_file_path=settings.log_file_path,
+        log_max_bytes=settings.log_max_bytes,
+        log_backup_count=settings.log_backup_count,
+    )
+
     allow_all_origins = settings.debug
+    allowed_origin_set = settings.allowed_origins_set
     allowed_origins = ["*"] if allow_all_origins else settings.allowed_origins_list
     allowed_hosts: list[str] = []
     public_url = settings.public_base_url.strip()
@@ -198,10 +425,14 @@ def create_app() -> FastAPI:
 
     @contextlib.asynccontextmanager
     async def _lifespan(_: FastAPI):
-        async with mcp.session_manager.run():
+        async with contextlib.AsyncExitStack() as stack:
+            await stack.enter_async_context(mcp.session_manager.run())
+            if settings.oauth_enabled:
+                preload_keys()
+                await stack.enter_async_context(sync_revocations())
             yield
 
-    app = FastAPI(lifespan=_lifespan)
+    app = FastAPI(lifespan=_lifespan, default_response_class=ORJSONResponse)
 
     app.add_middleware(
         CORSMiddleware,
@@ -214,23 +445,11 @@ def create_app() -> FastAPI:
             "content-type",
         ],
         expose_headers=["mcp-session-id"],
+        max_age=settings.cors_max_age_seconds,
     )
 
-    @app.middleware("http")
-    async def validate_origin(request: Request, call_next):
-        if allow_all_origins:
-            return await call_next(request)
-        path = request.url.path
-        if path.startswith(("/login", "/authorize", "/.well-known/")):
-            return await call_next(request)
-        origin = request.headers.get("origin")
-        if origin and origin not in settings.allowed_origins_list:
-            logger.warning(
-                "Blocked request with disallowed origin",
-                extra={"extra_fields": {"origin": origin, "path": request.url.path}},
-            )
-            return JSONResponse(status_code=403, content={"error": "Origin not allowed"})
-        return await call_next(request)
+    if not allow_all_origins:
+        app.add_middleware(OriginValidationMiddleware, allowed_origins=allowed_origin_set)
 
     # Add OAuth middleware to protect MCP endpoints (if enabled)
     if settings.oauth_enabled:
@@ -239,15 +458,11 @@ def create_app() -> FastAPI:
     else:
         logger.warning("OAuth authentication is DISABLED - using mock user ID for all requests")
 
-    @app.get("/health")
-    async def health_check() -> dict[str, str]:
-        return {"status": "ok"}
-
-    @app.get("/manifest.json")
-    async def manifest() -> dict[str, Any]:
-        base_url = settings.public_base_url.rstrip("/")
-        endpoint = f"{base_url}/mcp" if base_url else "/mcp"
-        return {
+    # Health and manifest bodies never change after startup; serialize them once
+    base_url = settings.public_base_url.rstrip("/")
+    endpoint = f"{base_url}/mcp" if base_url else "/mcp"
+    manifest_body = orjson.dumps(
+        {
             "name": settings.app_name,
             "version": settings.app_version,
             "mcp": {
@@ -264,109 +479,32 @@ def create_app() -> FastAPI:
                 "schedule_workflow",
             ],
         }
+    )
+    health_response = Response(content=b'{"status":"ok"}', media_type="application/json")
+    manifest_response = Response(content=manifest_body, media_type="application/json")
+    verification_token = (settings.openai_apps_verification_token or "").strip()
+    verification_response = (
+        Response(content=verification_token, media_type="text/plain")
+        if verification_token
+        else Response(status_code=404)
+    )
+
+    @app.get("/health", response_class=Response)
+    async def health_check() -> Response:
+        return health_response
 
-    @app.get(settings.openai_apps_verification_path)
+    @app.get("/manifest.json", response_class=Response)
+    async def manifest() -> Response:
+        return manifest_response
+
+    @app.get(settings.openai_apps_verification_path, response_class=Response)
     async def openai_domain_verification() -> Response:
         logger.info("OpenAI domain verification requested with token: %s", settings.openai_apps_verification_token)
-        token = (settings.openai_apps_verification_token or "").strip()
-        if not token:
-            return Response(status_code=404)
-        return Response(content=token, media_type="text/plain")
+        return verification_response
 
-    @mcp.resource(UI_TEMPLATE_URI, mime_type="text/html+skybridge")
+    @mcp.resource(UI_TEMPLATE_URI, mime_type=WIDGET_MIME_TYPE)
     def tasks_widget() -> str:
-        return """
-<!doctype html>
-<html lang=\"en\">
-  <head>
-    <meta charset=\"utf-8\" />
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-    <style>
-      body { font-family: ui-sans-serif, system-ui, -apple-system, sans-serif; margin: 0; padding: 16px; }
-      .summary { font-weight: 600; margin-bottom: 12px; }
-      table { width: 100%; border-collapse: collapse; }
-      th, td { text-align: left; padding: 8px; border-bottom: 1px solid #e5e7eb; }
-      .badge { display: inline-block; padding: 2px 8px; border-radius: 12px; font-size: 12px; background: #eef2ff; }
-      .empty { color: #6b7280; }
-    </style>
-  </head>
-  <body>
-    <div id=\"root\"></div>
-    <script>
-      const root = document.getElementById("root");
-      const meta = window.openai?.toolResponseMetadata || {};
-      let output = window.openai?.toolOutput || {};
-
-      const tryParse = (value) => {
-        if (typeof value !== "string") return value;
-        try {
-          return JSON.parse(value);
-        } catch (err) {
-          return value;
-        }
-      };
-
-      output = tryParse(output);
-      output.result = tryParse(output.result);
-
-      const payload =
-        output.payload ||
-        output.data ||
-        output.result?.payload ||
-        output.result?.data ||
-        meta.ui?.payload ||
-        {};
-
-      const tasks =
-        payload.tasks ||
-        output.tasks ||
-        output.result?.tasks ||
-        [];
-
-      const message = output.message || payload.message || "Tasks";
-
-      root.innerHTML = "";
-      const summary = document.createElement("div");
-      summary.className = "summary";
-      summary.textContent = message;
-      root.appendChild(summary);
-
-      if (!tasks.length) {
-        const empty = document.createElement("div");
-        empty.className = "empty";
-        empty.textContent = "No tasks to display.";
-        root.appendChild(empty);
-      } else {
-        const table = document.createElement("table");
-        table.innerHTML = `
-          <thead>
-            <tr>
-              <th>Title</th>
-              <th>Status</th>
-              <th>Priority</th>
-              <th>Due</th>
-            </tr>
-          </thead>
-          <tbody>
-            ${tasks
-              .map(
-                (task) => `
-              <tr>
-                <td>${task.title}</td>
-                <td><span class=\"badge\">${task.status}</span></td>
-                <td>${task.priority || ""}</td>
-                <td>${task.due_date || ""}</td>
-              </tr>`
-              )
-              .join("")}
-          </tbody>
-        `;
-        root.appendChild(table);
-      }
-    </script>
-  </body>
-</html>
-""".strip()
+        return TASKS_WIDGET_HTML
 
     # TODO: Fix FastMCP list_resources decorator issue
     # @mcp.list_resources()
@@ -384,8 +522,8 @@ def create_app() -> FastAPI:
     @mcp.tool(
         name="create_task",
         title="Create Task",
-        meta=_tool_meta(UI_TEMPLATE_URI, "Creating task…", "Task created."),
-        annotations=_tool_annotations(read_only=False, open_world=False, destructive=False),
+        meta=_CREATE_TASK_META,
+        annotations=_WRITE_ANNOTATIONS,
     )
     async def create_task(
         title: str,
@@ -393,7 +531,7 @@ def create_app() -> FastAPI:
         due_date: str | None = None,
         priority: Literal["low", "medium", "high"] = "medium",
         ctx: Context | None = None,
-    ) -> dict[str, Any]:
+    ) -> CallToolResult:
         user_id = _user_id_from_context(ctx)
         result = await create_task_tool(
             {
@@ -409,15 +547,15 @@ def create_app() -> FastAPI:
     @mcp.tool(
         name="list_tasks",
         title="List Tasks",
-        meta=_tool_meta(UI_TEMPLATE_URI, "Fetching tasks…", "Tasks ready."),
-        annotations=_tool_annotations(read_only=True, open_world=False, destructive=False),
+        meta=_LIST_TASKS_META,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
     async def list_tasks(
         status: Literal["pending", "in_progress", "completed"] | None = None,
         priority: Literal["low", "medium", "high"] | None = None,
         overdue: bool | None = None,
         ctx: Context | None = None,
-    ) -> dict[str, Any]:
+    ) -> CallToolResult:
         user_id = _user_id_from_context(ctx)
         result = await list_tasks_tool(
             {"status": status, "priority": priority, "overdue": overdue},
@@ -428,14 +566,14 @@ def create_app() -> FastAPI:
     @mcp.tool(
         name="update_task_status",
         title="Update Task Status",
-        meta=_tool_meta(UI_TEMPLATE_URI, "Updating task…", "Task updated."),
-        annotations=_tool_annotations(read_only=False, open_world=False, destructive=False),
+        meta=_UPDATE_TASK_STATUS_META,
+        annotations=_WRITE_ANNOTATIONS,
     )
     async def update_task_status(
         task_id: str,
         status: Literal["pending", "in_progress", "completed"],
         ctx: Context | None = None,
-    ) -> dict[str, Any]:
+    ) -> CallToolResult:
         user_id = _user_id_from_context(ctx)
         result = await update_task_status_tool(
             {"task_id": task_id, "status": status},
@@ -446,15 +584,18 @@ def create_app() -> FastAPI:
     @mcp.tool(
         name="trigger_integration",
         title="Trigger Integration",
-        meta=_tool_meta(UI_TEMPLATE_URI, "Triggering integration…", "Integration triggered."),
-        annotations=_tool_annotations(read_only=False, open_world=True, destructive=False),
+        meta=_TRIGGER_INTEGRATION_META,
+        annotations=_OPEN_WORLD_ANNOTATIONS,
     )
     async def trigger_integration(
         integration_type: Literal["jira", "email", "slack"],
         action: str,
         data: dict[str, Any] | None = None,
         ctx: Context | None = None,
-    ) -> dict[str, Any]:
+    ) -> CallToolResult:
+        # Imported on first use: pulls in the SMTP client, which nothing else needs
+        from .tools.integrations import trigger_integration_tool
+
         user_id = _user_id_from_context(ctx)
         result = await trigger_integration_tool(
             {
@@ -469,53 +610,29 @@ def create_app() -> FastAPI:
     @mcp.tool(
         name="generate_report",
         title="Generate Report",
-        meta=_tool_meta(UI_TEMPLATE_URI, "Generating report…", "Report ready."),
-        annotations=_tool_annotations(read_only=True, open_world=False, destructive=False),
+        meta=_GENERATE_REPORT_META,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
     async def generate_report(
         report_type: Literal["weekly", "monthly", "productivity"],
         format: Literal["json", "pdf", "csv"] | None = None,
         ctx: Context | None = None,
-    ) -> dict[str, Any]:
-        return {
-            "structuredContent": {
-                "success": False,
-                "message": "Report generation will be available in Phase 2",
-            },
-            "content": [
-                {
-                    "type": "text",
-                    "text": "Report generation will be available in Phase 2",
-                }
-            ],
-            "_meta": {"ui": {"view": "report_placeholder"}},
-        }
+    ) -> CallToolResult:
+        return _GENERATE_REPORT_RESULT
 
     @mcp.tool(
         name="schedule_workflow",
         title="Schedule Workflow",
-        meta=_tool_meta(UI_TEMPLATE_URI, "Scheduling workflow…", "Workflow scheduled."),
-        annotations=_tool_annotations(read_only=False, open_world=False, destructive=False),
+        meta=_SCHEDULE_WORKFLOW_META,
+        annotations=_WRITE_ANNOTATIONS,
     )
     async def schedule_workflow(
         workflow_name: str,
         schedule: str | None = None,
         actions: list[dict[str, Any]] | None = None,
         ctx: Context | None = None,
-    ) -> dict[str, Any]:
-        return {
-            "structuredContent": {
-                "success": False,
-                "message": "Workflow scheduling will be available in Phase 2",
-            },
-            "content": [
-                {
-                    "type": "text",
-                    "text": "Workflow scheduling will be available in Phase 2",
-                }
-            ],
-            "_meta": {"ui": {"view": "workflow_placeholder"}},
-        }
+    ) -> CallToolResult:
+        return _SCHEDULE_WORKFLOW_RESULT
 
     # Include OAuth routes
     app.include_router(oauth_router, tags=["oauth"])
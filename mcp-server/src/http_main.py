@@ -12,8 +12,8 @@ logger = get_logger(__name__)
 
 
 def main() -> None:
-    logger.info(f"Starting HTTP server for {settings.app_name} v{settings.app_version}")
     app = create_app()
+    logger.info(f"Starting HTTP server for {settings.app_name} v{settings.app_version}")
     uvicorn.run(
         app,
         host=settings.host,
@@ -5,10 +5,13 @@ NO AI/LLM calls are made from this server - only business operations.
 """
 
 import asyncio
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import TextContent
+from mcp.types import TextContent, Tool
 from .config import settings
+from .tools.integrations import trigger_integration_tool
+from .tools.tasks import create_task_tool, list_tasks_tool, update_task_status_tool
 from .utils.logging import setup_logging, get_logger
 
 # Configure production-ready logging
@@ -27,11 +30,30 @@ logger = get_logger(__name__)
 # Create MCP server instance
 app = Server(settings.app_name)
 
+# Tool name -> business logic handler, built once at import
+_TOOL_HANDLERS = {
+    "create_task": create_task_tool,
+    "list_tasks": list_tasks_tool,
+    "update_task_status": update_task_status_tool,
+    "trigger_integration": trigger_integration_tool,
+}
 
-@app.list_tools()
-async def list_tools():
-    """List available MCP tools for workflow orchestration."""
-    return [
+
+def _deferred_result(error: str) -> list[TextContent]:
+    return [TextContent(type="text", text=orjson.dumps({"success": False, "error": error}).decode())]
+
+
+# Phase 2 tools answer with a fixed result, so it is built once
+_DEFERRED_TOOL_RESULTS = {
+    "generate_report": _deferred_result("Report generation will be available in Phase 2"),
+    "schedule_workflow": _deferred_result("Workflow scheduling will be available in Phase 2"),
+}
+
+
+# Tool definitions are static; validated into Tool models once at import
+_TOOLS_SCHEMA: list[Tool] = [
+    Tool.model_validate(definition)
+    for definition in [
         {
             "name": "create_task",
             "description": "Create a new task in the system",
@@ -139,6 +161,13 @@ async def list_tools():
             },
         },
     ]
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools for workflow orchestration."""
+    return _TOOLS_SCHEMA
 
 
 @app.call_tool()
@@ -155,75 +184,31 @@ async def call_tool(name: str, arguments: dict):
 
     # Tool implementations - All tools perform pure business logic, NO AI/LLM calls
     try:
-        if name == "create_task":
-            from .tools.tasks import create_task_tool
-
-            result = await create_task_tool(arguments, mock_user_id)
-            return [TextContent(type="text", text=str(result))]
-
-        elif name == "list_tasks":
-            from .tools.tasks import list_tasks_tool
-
-            result = await list_tasks_tool(arguments, mock_user_id)
-            return [TextContent(type="text", text=str(result))]
-
-        elif name == "update_task_status":
-            from .tools.tasks import update_task_status_tool
-
-            result = await update_task_status_tool(arguments, mock_user_id)
-            return [TextContent(type="text", text=str(result))]
-
-        elif name == "trigger_integration":
-            from .tools.integrations import trigger_integration_tool
-
-            result = await trigger_integration_tool(arguments, mock_user_id)
-            return [TextContent(type="text", text=str(result))]
-
-        elif name == "generate_report":
-            # Report generation - deferred to Phase 2
-            logger.warning("Report generation not yet implemented")
-            return [
-                TextContent(
-                    type="text",
-                    text=str(
-                        {
-                            "success": False,
-                            "error": "Report generation will be available in Phase 2",
-                        }
-                    ),
-                )
-            ]
-
-        elif name == "schedule_workflow":
-            # Workflow scheduling - deferred to Phase 2
-            logger.warning("Workflow scheduling not yet implemented")
-            return [
-                TextContent(
-                    type="text",
-                    text=str(
-                        {
-                            "success": False,
-                            "error": "Workflow scheduling will be available in Phase 2",
-                        }
-                    ),
-                )
-            ]
-
-        else:
-            logger.error(f"Unknown tool: {name}")
-            raise ValueError(f"Unknown tool: {name}")
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is not None:
+            result = await handler(arguments, mock_user_id)
+            return [TextContent(type="text", text=orjson.dumps(result).decode())]
+
+        deferred = _DEFERRED_TOOL_RESULTS.get(name)
+        if deferred is not None:
+            # Report generation and workflow scheduling - deferred to Phase 2
+            logger.warning(f"{name} not yet implemented")
+            return deferred
+
+        logger.error(f"Unknown tool: {name}")
+        raise ValueError(f"Unknown tool: {name}")
 
     except Exception as e:
         logger.error(f"Tool execution error: {e}", exc_info=True)
         return [
             TextContent(
                 type="text",
-                text=str(
+                text=orjson.dumps(
                     {
                         "success": False,
                         "error": f"Tool execution failed: {str(e)}",
                     }
-                ),
+                ).decode(),
             )
         ]
 
@@ -3,10 +3,23 @@
 These are SQLAlchemy ORM models mapped to PostgreSQL tables.
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    false,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+from typing import Optional
 import uuid
 from ..database import Base
 from ..utils.logging import get_logger
@@ -24,7 +37,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     oauth_sub = Column(String(255), unique=True, nullable=False, index=True)
     email = Column(String(255), nullable=True)
     name = Column(String(255), nullable=True)
@@ -88,9 +101,17 @@ class Task(Base):
     @property
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
-        if not self.due_date or self.status == "completed":
+        return self.overdue(self.due_date, self.status)
+
+    @staticmethod
+    def overdue(due_date: Optional[datetime], status: str, now: Optional[datetime] = None) -> bool:
+        """Check if a task with this due date and status is overdue.
+
+        Shared with queries that select columns instead of Task instances.
+        """
+        if not due_date or status == "completed":
             return False
-        return self.due_date < utcnow()
+        return due_date < (now or utcnow())
 
 
 class TaskAuditLog(Base):
@@ -111,7 +132,8 @@ class TaskAuditLog(Base):
     action = Column(String(50), nullable=False)  # created, status_update, deleted, etc.
     old_status = Column(String(50), nullable=True)
     new_status = Column(String(50), nullable=True)
-    extra_data = Column(Text, nullable=True)  # JSON string for additional context (renamed from 'metadata' to avoid SQLAlchemy conflict)
+    # JSON string for additional context (renamed from 'metadata' to avoid SQLAlchemy conflict)
+    extra_data = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False, index=True)
 
     # Relationships
@@ -133,13 +155,15 @@ class OAuthClient(Base):
 
     __tablename__ = "oauth_clients"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    client_id = Column(String(255), unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    client_id = Column(String(255), nullable=False)
     client_name = Column(String(255), nullable=False)
     client_uri = Column(String(500), nullable=True)
-    redirect_uris = Column(Text, nullable=False)  # JSON array of allowed redirect URIs
-    grant_types = Column(Text, nullable=False, default='["authorization_code", "refresh_token"]')
-    response_types = Column(Text, nullable=False, default='["code"]')
+    redirect_uris = Column(JSONB, nullable=False)  # List of allowed redirect URIs
+    grant_types = Column(
+        JSONB, nullable=False, default=lambda: ["authorization_code", "refresh_token"]
+    )
+    response_types = Column(JSONB, nullable=False, default=lambda: ["code"])
     scope = Column(String(500), nullable=False, default="tasks.read tasks.write offline_access")
     token_endpoint_auth_method = Column(String(50), nullable=False, default="none")  # "none" for PKCE public clients
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
@@ -149,6 +173,16 @@ class OAuthClient(Base):
     authorization_codes = relationship("OAuthAuthorizationCode", back_populates="client", cascade="all, delete-orphan")
     tokens = relationship("OAuthToken", back_populates="client", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Covers get_client_by_client_id, so client lookups are index-only scans
+        Index(
+            "ix_oauth_clients_client_id",
+            "client_id",
+            unique=True,
+            postgresql_include=["id", "redirect_uris"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<OAuthClient(id={self.id}, client_id={self.client_id}, client_name={self.client_name})>"
 
@@ -158,16 +192,27 @@ class OAuthAuthorizationCode(Base):
 
     __tablename__ = "oauth_authorization_codes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     code = Column(String(255), unique=True, nullable=False, index=True)
-    client_id = Column(UUID(as_uuid=True), ForeignKey("oauth_clients.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    client_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("oauth_clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     redirect_uri = Column(String(500), nullable=False)
     scope = Column(String(500), nullable=False)
     code_challenge = Column(String(255), nullable=False)  # PKCE code challenge
     code_challenge_method = Column(String(10), nullable=False, default="S256")  # S256 or plain
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    used = Column(String(10), nullable=False, default="false")  # "true" or "false" to track if code was exchanged
+    # Set once the code is exchanged
+    used = Column(Boolean, nullable=False, default=False, server_default=false())
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
 
     # Relationships
@@ -176,9 +221,7 @@ class OAuthAuthorizationCode(Base):
 
     # Constraints
     __table_args__ = (
-        CheckConstraint("used IN ('true', 'false')", name="valid_used_flag"),
         CheckConstraint("code_challenge_method IN ('S256', 'plain')", name="valid_code_challenge_method"),
-        Index("ix_auth_codes_expires_at", "expires_at"),
     )
 
     def __repr__(self) -> str:
@@ -195,18 +238,27 @@ class OAuthToken(Base):
 
     __tablename__ = "oauth_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    access_token = Column(Text, nullable=False)  # JWT can be long
-    refresh_token = Column(Text, nullable=True)
-    access_token_hash = Column(String(64), unique=True, nullable=False, index=True)
-    refresh_token_hash = Column(String(64), unique=True, nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    access_token_hash = Column(LargeBinary(32), nullable=False)  # SHA-256 digest
+    refresh_token_hash = Column(LargeBinary(32), unique=True, nullable=True, index=True)
+    access_token_jti = Column(String(36), nullable=True)  # jti claim of the current access token
     token_type = Column(String(50), nullable=False, default="Bearer")
-    client_id = Column(UUID(as_uuid=True), ForeignKey("oauth_clients.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    client_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("oauth_clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     scope = Column(String(500), nullable=False)
     access_token_expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     refresh_token_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
-    revoked = Column(String(10), nullable=False, default="false")  # "true" or "false"
+    revoked = Column(Boolean, nullable=False, default=False, server_default=false())
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
 
@@ -216,9 +268,20 @@ class OAuthToken(Base):
 
     # Constraints
     __table_args__ = (
-        CheckConstraint("revoked IN ('true', 'false')", name="valid_revoked_flag"),
-        Index("ix_tokens_access_expires", "access_token_expires_at"),
-        Index("ix_tokens_refresh_expires", "refresh_token_expires_at"),
+        # Covering index: the per-request revocation check is an index-only scan
+        Index(
+            "ix_oauth_tokens_access_token_hash",
+            "access_token_hash",
+            unique=True,
+            postgresql_include=["revoked", "access_token_expires_at"],
+        ),
+        # Revoked, unexpired jtis loaded into the revocation list at startup
+        Index(
+            "ix_oauth_tokens_revoked_access_expires",
+            "access_token_expires_at",
+            postgresql_include=["access_token_jti"],
+            postgresql_where=text("revoked"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,173 @@
+"""Redis cache for list_tasks results - Pure business logic, NO AI.
+
+Each user's cached task lists live in one Redis hash, one field per filter
+combination, so any task write for that user drops them all with a single
+DEL. The cache fails open: if Redis is unreachable, lookups miss and the
+tools query PostgreSQL as before.
+
+Writers also bump a per-user generation counter. A listing records the
+generation it read before querying PostgreSQL, and its result is only stored
+if no write bumped the counter in between, so a slow read cannot put a list
+back that a concurrent write just invalidated.
+"""
+
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from ..config import settings
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# After a Redis error, skip the cache for this long instead of paying a
+# failed connection attempt on every tool call.
+_RETRY_AFTER_SECONDS = 30.0
+
+# Generation counters outlive any cached list; an idle user's counter expires
+# and restarts from "missing", which never equals a generation read earlier.
+_GENERATION_TTL_SECONDS = 86400
+
+# Store a list only if the user's generation is still the one read before the
+# query. KEYS: list hash, generation counter. ARGV: generation, field, value, ttl.
+_STORE_IF_CURRENT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4], 'NX')
+return 1
+"""
+
+_client: Optional[redis.Redis] = None
+_store_if_current: Any = None
+_unavailable_until = 0.0
+
+# Users whose invalidation was skipped or failed while Redis was backing off.
+# Their cached lists may still be in Redis, so they are invalidated before the
+# cache serves or stores anything again.
+_pending_invalidations: Set[str] = set()
+
+
+async def _get_client() -> Optional[redis.Redis]:
+    """Return the shared Redis client, or None while caching is off or Redis is down."""
+    global _client, _store_if_current
+    if settings.task_list_cache_ttl_seconds <= 0 or time.monotonic() < _unavailable_until:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.redis_url,
+            db=settings.redis_db,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+    if _store_if_current is None:
+        _store_if_current = _client.register_script(_STORE_IF_CURRENT)
+    if _pending_invalidations:
+        pending = list(_pending_invalidations)
+        try:
+            await _bump_generations(_client, pending)
+        except RedisError as e:
+            _mark_unavailable(e)
+            return None
+        _pending_invalidations.difference_update(pending)
+    return _client
+
+
+def _mark_unavailable(error: RedisError) -> None:
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + _RETRY_AFTER_SECONDS
+    logger.warning(f"Task list cache disabled for {_RETRY_AFTER_SECONDS:.0f}s: {error}")
+
+
+def _user_key(user_id: str) -> str:
+    return f"tasks:{user_id}"
+
+
+def _generation_key(user_id: str) -> str:
+    return f"tasks:{user_id}:gen"
+
+
+def _filters_field(arguments: Dict[str, Any]) -> bytes:
+    return orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+
+
+async def _bump_generations(client: redis.Redis, user_ids: list[str]) -> None:
+    """Invalidate in-flight listings and drop the cached lists of these users."""
+    async with client.pipeline(transaction=True) as pipe:
+        for user_id in user_ids:
+            pipe.incr(_generation_key(user_id))
+            pipe.expire(_generation_key(user_id), _GENERATION_TTL_SECONDS)
+            pipe.delete(_user_key(user_id))
+        await pipe.execute()
+
+
+async def get_cached_task_list(
+    user_id: str, arguments: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Return a cached list_tasks result for these filters, if there is one.
+
+    Also returns the user's current generation, to be passed to
+    cache_task_list; it is None when the cache is unavailable.
+    """
+    client = await _get_client()
+    if client is None:
+        return None, None
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hget(_user_key(user_id), _filters_field(arguments))
+            pipe.get(_generation_key(user_id))
+            cached, generation = await pipe.execute()
+    except RedisError as e:
+        _mark_unavailable(e)
+        return None, None
+    generation = generation.decode() if generation is not None else ""
+    return (orjson.loads(cached) if cached is not None else None), generation
+
+
+async def cache_task_list(
+    user_id: str, arguments: Dict[str, Any], result: Dict[str, Any], generation: Optional[str]
+) -> None:
+    """Store a list_tasks result, unless a task write happened since generation was read."""
+    if generation is None:
+        return
+    client = await _get_client()
+    if client is None:
+        return
+    try:
+        # The TTL starts with the first cached list, so no entry in the hash
+        # outlives it (time-based fields like is_overdue drift).
+        await _store_if_current(
+            keys=[_user_key(user_id), _generation_key(user_id)],
+            args=[
+                generation,
+                _filters_field(arguments),
+                orjson.dumps(result),
+                settings.task_list_cache_ttl_seconds,
+            ],
+        )
+    except RedisError as e:
+        _mark_unavailable(e)
+
+
+async def invalidate_task_lists(user_id: str) -> None:
+    """Drop every cached task list for a user after one of their tasks changed.
+
+    While Redis is backing off after an error, the user is remembered and
+    invalidated before the cache serves or stores anything again, so a write
+    made during the backoff never leaves stale lists behind.
+    """
+    if settings.task_list_cache_ttl_seconds <= 0:
+        return
+    client = await _get_client()
+    if client is None:
+        _pending_invalidations.add(user_id)
+        return
+    try:
+        await _bump_generations(client, [user_id])
+    except RedisError as e:
+        _pending_invalidations.add(user_id)
+        _mark_unavailable(e)
@@ -9,18 +9,31 @@ These tools provide CRUD operations for task management:
 from typing import Dict, Any
 from datetime import datetime, timezone
 from uuid import UUID
-import json
 
+import orjson
 from mcp.types import Tool, TextContent
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.database import Task, TaskAuditLog, User
 from ..database import AsyncSessionLocal
+from ..services.task_cache import cache_task_list, get_cached_task_list, invalidate_task_lists
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Columns returned by list_tasks (is_overdue is derived via Task.overdue)
+_TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.created_at,
+    Task.updated_at,
+)
+
 
 async def create_task_tool(arguments: Dict[str, Any], user_id: str) -> Dict[str, Any]:
     """Create a new task - pure business logic, NO AI.
@@ -83,6 +96,7 @@ async def create_task_tool(arguments: Dict[str, Any], user_id: str) -> Dict[str,
 
             db.add(new_task)
             await db.commit()
+            await invalidate_task_lists(user_id)
             await db.refresh(new_task)
 
             # Create audit log
@@ -91,7 +105,7 @@ async def create_task_tool(arguments: Dict[str, Any], user_id: str) -> Dict[str,
                 user_id=UUID(user_id),
                 action="created",
                 new_status="pending",
-                extra_data=json.dumps({"title": new_task.title, "priority": new_task.priority}),
+                extra_data=orjson.dumps({"title": new_task.title, "priority": new_task.priority}).decode(),
             )
             db.add(audit)
             await db.commit()
@@ -144,6 +158,11 @@ async def list_tasks_tool(arguments: Dict[str, Any], user_id: str) -> Dict[str,
         result = await list_tasks_tool({"overdue": True}, user_id="user-uuid")
         ```
     """
+    # Repeated identical listings are answered from Redis until a task changes
+    cached, cache_generation = await get_cached_task_list(user_id, arguments)
+    if cached is not None:
+        return cached
+
     async with AsyncSessionLocal() as db:
         try:
             logger.info(
@@ -152,7 +171,7 @@ async def list_tasks_tool(arguments: Dict[str, Any], user_id: str) -> Dict[str,
             )
 
             # Build query with filters
-            query = select(Task).where(Task.user_id == UUID(user_id))
+            query = select(*_TASK_LIST_COLUMNS).where(Task.user_id == UUID(user_id))
 
             # Apply filters
             if arguments.get("status"):
@@ -170,38 +189,42 @@ async def list_tasks_tool(arguments: Dict[str, Any], user_id: str) -> Dict[str,
 
             # Execute query
             result = await db.execute(query.order_by(Task.created_at.desc()))
-            tasks = result.scalars().all()
 
-            logger.info(
-                f"Found {len(tasks)} tasks",
-                extra={"extra_fields": {"count": len(tasks), "filters": arguments}},
-            )
-
-            # Format task data
+            # Format task data straight from the rows: no ORM instances are
+            # built, so a large listing is held in memory only once.
+            now = datetime.now(timezone.utc)
             tasks_data = [
                 {
-                    "id": str(task.id),
-                    "title": task.title,
-                    "description": task.description,
-                    "status": task.status,
-                    "priority": task.priority,
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                    "created_at": task.created_at.isoformat(),
-                    "updated_at": task.updated_at.isoformat(),
-                    "is_overdue": task.is_overdue,
+                    "id": str(row.id),
+                    "title": row.title,
+                    "description": row.description,
+                    "status": row.status,
+                    "priority": row.priority,
+                    "due_date": row.due_date.isoformat() if row.due_date else None,
+                    "created_at": row.created_at.isoformat(),
+                    "updated_at": row.updated_at.isoformat(),
+                    "is_overdue": Task.overdue(row.due_date, row.status, now),
                 }
-                for task in tasks
+                for row in result
             ]
+            count = len(tasks_data)
 
-            return {
+            logger.info(
+                f"Found {count} tasks",
+                extra={"extra_fields": {"count": count, "filters": arguments}},
+            )
+
+            response = {
                 "success": True,
                 "data": {
                     "tasks": tasks_data,
-                    "count": len(tasks),
+                    "count": count,
                     "filters_applied": arguments,
                 },
-                "message": f"Found {len(tasks)} task(s)",
+                "message": f"Found {count} task(s)",
             }
+            await cache_task_list(user_id, arguments, response, cache_generation)
+            return response
 
         except Exception as e:
             logger.error(f"Error listing tasks: {e}", exc_info=True)
@@ -275,6 +298,7 @@ async def update_task_status_tool(arguments: Dict[str, Any], user_id: str) -> Di
             task.updated_at = datetime.now(timezone.utc)
 
             await db.commit()
+            await invalidate_task_lists(user_id)
             await db.refresh(task)
 
             # Create audit log
@@ -284,7 +308,7 @@ async def update_task_status_tool(arguments: Dict[str, Any], user_id: str) -> Di
                 action="status_update",
                 old_status=old_status,
                 new_status=new_status,
-                extra_data=json.dumps({"title": task.title}),
+                extra_data=orjson.dumps({"title": task.title}).decode(),
             )
             db.add(audit)
             await db.commit()
@@ -57,3 +57,28 @@ def test_mcp_initialize() -> None:
     payload = response.json()
     assert payload["jsonrpc"] == "2.0"
     assert payload["result"]["serverInfo"]["name"] == settings.app_name
+
+
+def test_disallowed_origin_is_rejected() -> None:
+    with TestClient(create_app()) as client:
+        blocked = client.get("/health", headers={"origin": "https://evil.example"})
+        allowed = client.get("/health", headers={"origin": "https://chatgpt.com"})
+
+    assert blocked.status_code == 403
+    assert blocked.json() == {"error": "Origin not allowed"}
+    assert allowed.status_code == 200
+
+
+def test_cors_preflight_is_cacheable() -> None:
+    with TestClient(create_app()) as client:
+        response = client.options(
+            "/mcp",
+            headers={
+                "origin": "https://chatgpt.com",
+                "access-control-request-method": "POST",
+                "access-control-request-headers": "authorization, content-type",
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == str(settings.cors_max_age_seconds)
@@ -4,15 +4,17 @@ import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from datetime import datetime, timedelta, timezone
-import json
 
 from src.http_app import create_app
 from src.config import settings
 from sqlalchemy import text
 
 from src.database import engine, AsyncSessionLocal
-from src.models.database import User, OAuthClient
+from src.models.database import User, OAuthClient, OAuthToken
 from src.auth import create_access_token, generate_random_string
+from src.auth.middleware import OAuthMiddleware
+from src.auth.oauth_routes import _client_cache, router as oauth_router
+from src.auth.token_utils import hash_token
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -26,6 +28,7 @@ async def test_db(setup_database):
                 "RESTART IDENTITY CASCADE"
             )
         )
+    _client_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -45,9 +48,9 @@ async def test_oauth_client(test_db):
             client_id="test_client_id",
             client_name="Test ChatGPT App",
             client_uri="https://chatgpt.com",
-            redirect_uris=json.dumps(["https://chatgpt.com/aip/g-test/oauth/callback"]),
-            grant_types=json.dumps(["authorization_code", "refresh_token"]),
-            response_types=json.dumps(["code"]),
+            redirect_uris=["https://chatgpt.com/aip/g-test/oauth/callback"],
+            grant_types=["authorization_code", "refresh_token"],
+            response_types=["code"],
             scope="tasks.read tasks.write offline_access",
             token_endpoint_auth_method="none",
         )
@@ -77,6 +80,18 @@ class TestOAuthMetadata:
         assert "S256" in data["code_challenge_methods_supported"]
         assert "none" in data["token_endpoint_auth_methods_supported"]
 
+    @pytest.mark.asyncio
+    async def test_discovery_documents_are_cacheable(self, async_client):
+        """Discovery documents are served with a public Cache-Control header."""
+        for path in (
+            "/.well-known/oauth-protected-resource",
+            "/.well-known/oauth-authorization-server",
+            "/.well-known/openid-configuration",
+        ):
+            response = await async_client.get(path)
+            assert response.status_code == 200
+            assert response.headers["cache-control"] == "public, max-age=3600"
+
 
 class TestClientRegistration:
     """Test dynamic client registration endpoint."""
@@ -131,6 +146,84 @@ class TestAuthorizeEndpoint:
         assert location.startswith("https://chatgpt.com/aip/g-test/oauth/callback?code=")
         assert "state=random_state_string" in location
 
+    @pytest.mark.asyncio
+    async def test_demo_login_cookie_authorizes_under_eddsa(
+        self, async_client, test_oauth_client, tmp_path, monkeypatch
+    ):
+        """The demo session cookie set by /login is accepted by /authorize with EdDSA keys."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        private_path = tmp_path / "jwt.key"
+        public_path = tmp_path / "jwt.key.pub"
+        private_path.write_bytes(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        public_path.write_bytes(
+            private_key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        )
+        monkeypatch.setattr(settings, "jwt_algorithm", "EdDSA")
+        monkeypatch.setattr(settings, "jwt_private_key_path", str(private_path))
+        monkeypatch.setattr(settings, "jwt_public_key_path", str(public_path))
+        monkeypatch.setattr(settings, "demo_username", "reviewer")
+        monkeypatch.setattr(settings, "demo_password", "demo-password")
+
+        params = {
+            "response_type": "code",
+            "client_id": test_oauth_client.client_id,
+            "redirect_uri": "https://chatgpt.com/aip/g-test/oauth/callback",
+            "code_challenge": "test_code_challenge",
+            "code_challenge_method": "S256",
+        }
+        response = await async_client.get("/authorize", params=params)
+        assert response.status_code == 200  # login page
+
+        response = await async_client.post(
+            "/login",
+            data={"username": "reviewer", "password": "demo-password", "return_url": "/authorize"},
+            follow_redirects=False,
+        )
+        assert response.status_code == 302
+        assert "demo_session" in async_client.cookies
+
+        response = await async_client.get("/authorize", params=params, follow_redirects=False)
+        assert response.status_code == 302
+        assert response.headers["location"].startswith(
+            "https://chatgpt.com/aip/g-test/oauth/callback?code="
+        )
+
+    @pytest.mark.asyncio
+    async def test_authorize_encodes_state_in_redirect(self, async_client, test_oauth_client):
+        """Reserved characters in state survive the redirect back to the client."""
+        from urllib.parse import parse_qs, urlparse
+
+        state = "a&b=c #d"
+        response = await async_client.get(
+            "/authorize",
+            params={
+                "response_type": "code",
+                "client_id": test_oauth_client.client_id,
+                "redirect_uri": "https://chatgpt.com/aip/g-test/oauth/callback",
+                "state": state,
+                "code_challenge": "test_code_challenge",
+                "code_challenge_method": "S256",
+            },
+            follow_redirects=False,
+        )
+
+        assert response.status_code == 302
+        query = parse_qs(urlparse(response.headers["location"]).query)
+        assert query["state"] == [state]
+        assert len(query["code"]) == 1
+
     @pytest.mark.asyncio
     async def test_authorize_with_invalid_client_id(self, async_client):
         """Test /authorize with unknown client_id returns error."""
@@ -168,10 +261,78 @@ class TestAuthorizeEndpoint:
         assert data["error"] == "invalid_request"
         assert "redirect_uri" in data["error_description"]
 
+    def test_login_page_escapes_dynamic_values(self):
+        """The return URL and error are HTML-escaped into the sign-in page."""
+        from src.auth.oauth_routes import _login_page
+
+        page = _login_page('/authorize?state="><script>', error="<b>nope</b>")
+        assert b"<script>" not in page
+        assert b'value="/authorize?state=&quot;&gt;&lt;script&gt;"' in page
+        assert b"&lt;b&gt;nope&lt;/b&gt;" in page
+        assert page.startswith(b"<!doctype html>") and page.endswith(b"</html>")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_client_lookups_share_one_query(self, test_oauth_client):
+        """Concurrent cache misses for one client_id run a single query."""
+        import asyncio
+        from src.auth.oauth_routes import get_client_by_client_id
+
+        async with AsyncSessionLocal() as db:
+            queries = 0
+            execute = db.execute
+
+            async def counting_execute(*args, **kwargs):
+                nonlocal queries
+                queries += 1
+                return await execute(*args, **kwargs)
+
+            db.execute = counting_execute
+            clients = await asyncio.gather(
+                *(get_client_by_client_id(db, test_oauth_client.client_id) for _ in range(5))
+            )
+
+        assert queries == 1
+        assert {client.id for client in clients} == {test_oauth_client.id}
+
 
 class TestTokenEndpoint:
     """Test /token endpoint."""
 
+    @pytest_asyncio.fixture
+    async def issued_auth_code(self, test_oauth_client):
+        """Store an unexpired S256 authorization code; returns the /token form for it."""
+        from src.auth import compute_code_challenge
+        from src.models.database import OAuthAuthorizationCode
+
+        code = generate_random_string(32)
+        code_verifier = generate_random_string(64)
+        redirect_uri = "https://chatgpt.com/aip/g-test/oauth/callback"
+        async with AsyncSessionLocal() as db:
+            user = User(oauth_sub=f"code:{generate_random_string(8)}")
+            db.add(user)
+            await db.flush()
+            db.add(
+                OAuthAuthorizationCode(
+                    code=code,
+                    client_id=test_oauth_client.id,
+                    user_id=user.id,
+                    redirect_uri=redirect_uri,
+                    scope="tasks.read",
+                    code_challenge=compute_code_challenge(code_verifier, "S256"),
+                    code_challenge_method="S256",
+                    expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+                )
+            )
+            await db.commit()
+
+        return {
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": redirect_uri,
+            "code_verifier": code_verifier,
+            "client_id": test_oauth_client.client_id,
+        }
+
     @pytest.mark.asyncio
     async def test_token_with_unsupported_grant_type(self, async_client):
         """Test POST /token with unsupported grant_type returns error."""
@@ -203,6 +364,95 @@ class TestTokenEndpoint:
         data = response.json()
         assert data["error"] == "invalid_request"
 
+    @pytest.mark.asyncio
+    async def test_authorization_code_is_single_use(self, async_client, issued_auth_code):
+        """An authorization code can be exchanged for tokens exactly once."""
+        data = issued_auth_code
+        response = await async_client.post("/token", data=data)
+        assert response.status_code == 200
+        assert response.json()["token_type"] == "Bearer"
+
+        response = await async_client.post("/token", data=data)
+        assert response.status_code == 400
+        assert response.json()["error"] == "invalid_grant"
+
+    @pytest.mark.asyncio
+    async def test_failed_code_exchange_spends_the_code(self, async_client, issued_auth_code):
+        """A wrong code_verifier burns the code, so the right one cannot follow."""
+        wrong_verifier = {**issued_auth_code, "code_verifier": generate_random_string(64)}
+        response = await async_client.post("/token", data=wrong_verifier)
+        assert response.status_code == 400
+
+        response = await async_client.post("/token", data=issued_auth_code)
+        assert response.status_code == 400
+        assert response.json()["error"] == "invalid_grant"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_code_exchanges_issue_one_token_pair(
+        self, async_client, issued_auth_code
+    ):
+        """Simultaneous exchanges of one code yield a single token pair."""
+        import asyncio
+
+        responses = await asyncio.gather(
+            *(async_client.post("/token", data=issued_auth_code) for _ in range(3))
+        )
+        assert sorted(response.status_code for response in responses) == [200, 400, 400]
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(text("SELECT count(*) FROM oauth_tokens"))
+            assert result.scalar() == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_grant_stops_after_revocation(self, async_client, test_oauth_client):
+        """A refresh token can be reused until revoked, despite the verification cache."""
+        from src.auth import create_token_pair
+
+        async with AsyncSessionLocal() as db:
+            user = User(oauth_sub=f"refresh:{generate_random_string(8)}")
+            db.add(user)
+            await db.flush()
+            access_token, access_expires, refresh_token, refresh_expires = create_token_pair(
+                user.id, test_oauth_client.client_id, "tasks.read"
+            )
+            db.add(
+                OAuthToken(
+                    access_token_hash=hash_token(access_token),
+                    refresh_token_hash=hash_token(refresh_token),
+                    client_id=test_oauth_client.id,
+                    user_id=user.id,
+                    scope="tasks.read",
+                    access_token_expires_at=access_expires,
+                    refresh_token_expires_at=refresh_expires,
+                )
+            )
+            await db.commit()
+
+        data = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": test_oauth_client.client_id,
+        }
+        issued = []
+        for _ in range(2):
+            response = await async_client.post("/token", data=data)
+            assert response.status_code == 200
+            assert response.json()["refresh_token"] == refresh_token
+            issued.append(hash_token(response.json()["access_token"]))
+
+        # The current access token's status is pre-cached; the superseded one is not
+        from src.auth.middleware import _revocation_cache
+
+        assert _revocation_cache[issued[1]][0] is False
+        assert issued[0] not in _revocation_cache
+
+        await async_client.post("/revoke", data={"token": refresh_token})
+        assert issued[1] not in _revocation_cache
+
+        response = await async_client.post("/token", data=data)
+        assert response.status_code == 400
+        assert response.json()["error"] == "invalid_grant"
+
 
 class TestRevokeEndpoint:
     """Test /revoke endpoint."""
@@ -219,6 +469,194 @@ class TestRevokeEndpoint:
 
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_revoke_falls_back_when_hint_is_wrong(self, async_client, test_oauth_client):
+        """A token is revoked even when token_type_hint names the other token type."""
+        refresh_token = generate_random_string()
+        async with AsyncSessionLocal() as db:
+            user = User(oauth_sub=f"revoke:{generate_random_string(8)}")
+            db.add(user)
+            await db.flush()
+            token = OAuthToken(
+                access_token_hash=hash_token(generate_random_string()),
+                refresh_token_hash=hash_token(refresh_token),
+                client_id=test_oauth_client.id,
+                user_id=user.id,
+                scope="tasks.read",
+                access_token_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+                revoked=False,
+            )
+            db.add(token)
+            await db.commit()
+            token_id = token.id
+
+        response = await async_client.post(
+            "/revoke",
+            data={"token": refresh_token, "token_type_hint": "access_token"},
+        )
+
+        assert response.status_code == 200
+        async with AsyncSessionLocal() as db:
+            assert (await db.get(OAuthToken, token_id)).revoked is True
+
+
+class TestOAuthMiddleware:
+    """Test bearer token enforcement on protected paths."""
+
+    @pytest_asyncio.fixture
+    async def protected_client(self, test_db):
+        """Create a client for a minimal app protected by OAuthMiddleware."""
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        app.middleware("http")(OAuthMiddleware(protected_paths=["/mcp"]))
+
+        @app.get("/mcp/ping")
+        async def ping():
+            return {"ok": True}
+
+        app.include_router(oauth_router)
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+    @pytest_asyncio.fixture
+    async def issued_access_token(self, test_oauth_client):
+        """Issue an access token and store it like the /token endpoint does."""
+        async with AsyncSessionLocal() as db:
+            user = User(oauth_sub=f"middleware:{generate_random_string(8)}")
+            db.add(user)
+            await db.flush()
+            token, expires_at = create_access_token(
+                user.id, test_oauth_client.client_id, "tasks.read"
+            )
+            db.add(
+                OAuthToken(
+                    access_token_hash=hash_token(token),
+                    client_id=test_oauth_client.id,
+                    user_id=user.id,
+                    scope="tasks.read",
+                    access_token_expires_at=expires_at,
+                    revoked=False,
+                )
+            )
+            await db.commit()
+        return token
+
+    @pytest.mark.asyncio
+    async def test_missing_token_is_rejected(self, protected_client):
+        """Protected paths require a bearer token."""
+        response = await protected_client.get("/mcp/ping")
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"].startswith("Bearer ")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("separator", ["  ", "\t"])
+    async def test_bearer_token_with_extra_whitespace_is_accepted(
+        self, protected_client, issued_access_token, separator
+    ):
+        """Any whitespace run between scheme and token is accepted, as is trailing space."""
+        response = await protected_client.get(
+            "/mcp/ping",
+            headers={"Authorization": f"Bearer{separator}{issued_access_token} "},
+        )
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_is_rejected_on_next_request(
+        self, protected_client, issued_access_token
+    ):
+        """Revoking a token takes effect immediately despite the token caches."""
+        headers = {"Authorization": f"Bearer {issued_access_token}"}
+
+        for _ in range(2):
+            response = await protected_client.get("/mcp/ping", headers=headers)
+            assert response.status_code == 200
+
+        response = await protected_client.post("/revoke", data={"token": issued_access_token})
+        assert response.status_code == 200
+
+        response = await protected_client.get("/mcp/ping", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["error_description"] == "Token has been revoked"
+
+    @pytest.mark.asyncio
+    async def test_revoked_jti_is_rejected_without_db_status(
+        self, protected_client, issued_access_token
+    ):
+        """A jti on the in-memory revocation list is rejected even if its row is active."""
+        import jwt
+        from src.auth.revocation import mark_jti_revoked
+
+        claims = jwt.decode(issued_access_token, options={"verify_signature": False})
+        mark_jti_revoked(claims["jti"], claims["exp"])
+
+        response = await protected_client.get(
+            "/mcp/ping", headers={"Authorization": f"Bearer {issued_access_token}"}
+        )
+
+        assert response.status_code == 401
+        assert response.json()["error_description"] == "Token has been revoked"
+
+    @pytest.mark.asyncio
+    async def test_revocation_listener_reconnects_and_reloads(self, test_db, monkeypatch):
+        """A dropped LISTEN connection is re-established and the list reloaded."""
+        import asyncio
+        from src.auth import revocation
+
+        loads = []
+
+        async def counting_load():
+            loads.append(1)
+            return 0
+
+        monkeypatch.setattr(revocation, "_RECONNECT_DELAY_SECONDS", 0.01)
+        monkeypatch.setattr(revocation, "load_revoked_jtis", counting_load)
+
+        listening_pids = text(
+            "SELECT pid FROM pg_stat_activity WHERE query LIKE :query AND pid <> pg_backend_pid()"
+        ).bindparams(query=f"LISTEN %{revocation.REVOCATION_CHANNEL}%")
+
+        async def wait_for_listener():
+            for _ in range(200):
+                async with engine.connect() as conn:
+                    pids = (await conn.execute(listening_pids)).scalars().all()
+                if pids:
+                    return pids
+                await asyncio.sleep(0.02)
+            raise AssertionError("revocation listener never connected")
+
+        async with revocation.sync_revocations():
+            pids = await wait_for_listener()
+            async with engine.connect() as conn:
+                for pid in pids:
+                    await conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+
+            for _ in range(200):
+                if len(loads) >= 2:
+                    break
+                await asyncio.sleep(0.02)
+            assert len(loads) == 2
+            new_pids = await wait_for_listener()
+            assert not set(new_pids) & set(pids)
+
+            expires_at = int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {
+                        "channel": revocation.REVOCATION_CHANNEL,
+                        "payload": f"reconnected:{expires_at}",
+                    },
+                )
+            for _ in range(200):
+                if revocation.is_jti_revoked("reconnected"):
+                    break
+                await asyncio.sleep(0.02)
+            assert revocation.is_jti_revoked("reconnected")
+
 
 class TestJWTTokens:
     """Test JWT token generation and verification."""
@@ -239,6 +677,120 @@ class TestJWTTokens:
         assert isinstance(expires_at, datetime)
         assert expires_at > datetime.now(timezone.utc)
 
+    @pytest.mark.parametrize("algorithm", ["EdDSA", "RS256", "ES256"])
+    def test_asymmetric_token_round_trip(self, algorithm, tmp_path, monkeypatch):
+        """Tokens signed with a PEM private key verify against the public key."""
+        from uuid import uuid4
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+        from src.auth import verify_token
+
+        if algorithm == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "RS256":
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        else:
+            private_key = ec.generate_private_key(ec.SECP256R1())
+
+        private_path = tmp_path / "jwt.key"
+        public_path = tmp_path / "jwt.key.pub"
+        private_path.write_bytes(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        public_path.write_bytes(
+            private_key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        )
+        monkeypatch.setattr(settings, "jwt_algorithm", algorithm)
+        monkeypatch.setattr(settings, "jwt_private_key_path", str(private_path))
+        monkeypatch.setattr(settings, "jwt_public_key_path", str(public_path))
+
+        user_id = uuid4()
+        token, _ = create_access_token(user_id, "test_client", "tasks.read")
+        payload = verify_token(token, expected_token_type="access_token")
+
+        assert payload["sub"] == str(user_id)
+
+        # The demo login cookie is signed with the same key pair
+        from types import SimpleNamespace
+        from src.auth.oauth_routes import (
+            _create_demo_session_token,
+            _get_demo_username_from_cookie,
+        )
+
+        cookie = _create_demo_session_token("reviewer")
+        request = SimpleNamespace(cookies={"demo_session": cookie})
+        assert _get_demo_username_from_cookie(request) == "reviewer"
+
+    def test_create_token_pair(self):
+        """Access and refresh tokens from one call verify as their own types."""
+        from uuid import uuid4
+        from src.auth import create_token_pair, verify_token
+
+        user_id = uuid4()
+        access_token, access_expires, refresh_token, refresh_expires = create_token_pair(
+            user_id, "test_client", "tasks.read", jti="pair-jti"
+        )
+
+        access_payload = verify_token(access_token, expected_token_type="access_token")
+        refresh_payload = verify_token(refresh_token, expected_token_type="refresh_token")
+        assert access_payload["jti"] == "pair-jti"
+        assert access_payload["iat"] == refresh_payload["iat"]
+        assert refresh_payload["sub"] == str(user_id)
+        assert access_expires < refresh_expires
+
+    @pytest.mark.asyncio
+    async def test_asymmetric_signing_runs_off_event_loop(self, monkeypatch):
+        """Private-key signing is handed to a worker thread; HMAC stays inline."""
+        import threading
+        from src.auth import run_token_signing
+
+        monkeypatch.setattr(settings, "jwt_algorithm", "EdDSA")
+        assert await run_token_signing(threading.get_ident) != threading.get_ident()
+
+        monkeypatch.setattr(settings, "jwt_algorithm", "HS256")
+        assert await run_token_signing(threading.get_ident) == threading.get_ident()
+
+    def test_expired_token_is_rejected(self):
+        """Expired tokens fail with ExpiredSignatureError."""
+        from uuid import uuid4
+        from src.auth import ExpiredSignatureError, verify_token
+
+        token, _ = create_access_token(
+            uuid4(), "test_client", "tasks.read", expires_delta=timedelta(seconds=-1)
+        )
+
+        with pytest.raises(ExpiredSignatureError):
+            verify_token(token, expected_token_type="access_token")
+
+    def test_token_missing_required_claim_is_rejected(self):
+        """Validly signed tokens without a subject are rejected in the same decode."""
+        import time
+        import jwt
+        from src.auth import InvalidTokenError, verify_token
+
+        now = int(time.time())
+        token = jwt.encode(
+            {
+                "iss": settings.oauth_issuer or settings.public_base_url,
+                "aud": settings.public_base_url,
+                "iat": now,
+                "exp": now + 60,
+                "token_type": "access_token",
+            },
+            settings.jwt_secret,
+            algorithm=settings.jwt_algorithm,
+        )
+
+        with pytest.raises(InvalidTokenError):
+            verify_token(token, expected_token_type="access_token")
+
     @pytest.mark.asyncio
     async def test_pkce_verification(self):
         """Test PKCE code_verifier validation."""
@@ -254,6 +806,10 @@ class TestJWTTokens:
         wrong_verifier = generate_random_string(43)
         assert verify_pkce_challenge(wrong_verifier, code_challenge, "S256") is False
 
+        # Malformed challenges fail instead of raising
+        assert verify_pkce_challenge(code_verifier, code_challenge[:-1], "S256") is False
+        assert verify_pkce_challenge(code_verifier, "!" * 43, "S256") is False
+
     @pytest.mark.asyncio
     async def test_pkce_plain_method(self):
         """Test PKCE with plain method."""
@@ -5,9 +5,14 @@ These tests verify the business logic of MCP tools (NO AI/LLM calls).
 
 import pytest
 import pytest_asyncio
+import time
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.config import settings
+from src.services import task_cache
 from src.tools.tasks import create_task_tool, list_tasks_tool, update_task_status_tool
 from src.tools.integrations import trigger_integration_tool
 
@@ -153,6 +158,160 @@ class TestListTasksTool:
         assert result["success"] is True
         # Should have at least the overdue task we just created
         assert result["data"]["count"] >= 1
+        assert all(task["is_overdue"] for task in result["data"]["tasks"])
+
+
+class _InMemoryRedis:
+    """The slice of redis.asyncio.Redis the task list cache uses."""
+
+    def __init__(self):
+        self.hashes: dict = {}
+        self.strings: dict = {}
+        self.fail_invalidations = False
+
+    def pipeline(self, transaction=True):
+        return _InMemoryPipeline(self)
+
+    def register_script(self, script):
+        async def store_if_current(keys, args):
+            # Mirrors task_cache._STORE_IF_CURRENT
+            hash_key, generation_key = keys
+            generation, field, value, _ttl = args
+            current = self.strings.get(generation_key)
+            if (current.decode() if current is not None else "") != generation:
+                return 0
+            self.hashes.setdefault(hash_key, {})[field] = value
+            return 1
+
+        return store_if_current
+
+
+class _InMemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+        self.invalidates = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def hget(self, key, field):
+        self.commands.append(lambda: self.redis.hashes.get(key, {}).get(field))
+
+    def get(self, key):
+        self.commands.append(lambda: self.redis.strings.get(key))
+
+    def incr(self, key):
+        self.invalidates = True
+
+        def incr():
+            value = int(self.redis.strings.get(key, b"0")) + 1
+            self.redis.strings[key] = str(value).encode()
+            return value
+
+        self.commands.append(incr)
+
+    def expire(self, key, seconds, nx=False):
+        self.commands.append(lambda: True)
+
+    def delete(self, *keys):
+        self.commands.append(lambda: [self.redis.hashes.pop(key, None) for key in keys])
+
+    async def execute(self):
+        if self.redis.fail_invalidations and self.invalidates:
+            raise RedisConnectionError("connection reset")
+        return [command() for command in self.commands]
+
+
+class TestTaskListCache:
+    """Test list_tasks caching and invalidation on task writes."""
+
+    @pytest.fixture
+    def redis(self, monkeypatch):
+        fake = _InMemoryRedis()
+        monkeypatch.setattr(settings, "task_list_cache_ttl_seconds", 30)
+        monkeypatch.setattr(task_cache, "_client", fake)
+        monkeypatch.setattr(task_cache, "_store_if_current", None)
+        monkeypatch.setattr(task_cache, "_unavailable_until", 0.0)
+        monkeypatch.setattr(task_cache, "_pending_invalidations", set())
+        return fake
+
+    @staticmethod
+    async def _listed_tasks():
+        result = await list_tasks_tool({}, MOCK_USER_ID)
+        return {task["title"]: task for task in result["data"]["tasks"]}
+
+    @pytest.mark.asyncio
+    async def test_repeated_listing_is_served_from_cache(self, redis, monkeypatch):
+        """A second identical listing does not query PostgreSQL."""
+        first = await self._listed_tasks()
+
+        from src.tools import tasks
+
+        def no_database():
+            raise AssertionError("list_tasks queried the database on a cache hit")
+
+        monkeypatch.setattr(tasks, "AsyncSessionLocal", no_database)
+        assert await self._listed_tasks() == first
+
+    @pytest.mark.asyncio
+    async def test_task_writes_invalidate_cached_lists(self, redis):
+        """Creating or updating a task makes the next listing show the change."""
+        await self._listed_tasks()
+
+        title = f"Created after caching {uuid4()}"
+        created = await create_task_tool({"title": title}, MOCK_USER_ID)
+        listed = await self._listed_tasks()
+        assert listed[title]["status"] == "pending"
+
+        await update_task_status_tool(
+            {"task_id": created["data"]["id"], "status": "completed"}, MOCK_USER_ID
+        )
+        listed = await self._listed_tasks()
+        assert listed[title]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_read_is_not_overwritten(self, redis, monkeypatch):
+        """A list read before a concurrent write is not stored after that write."""
+        from src.tools import tasks
+
+        async def write_lands_after_query(user_id, arguments, result, generation):
+            await task_cache.invalidate_task_lists(user_id)
+            await task_cache.cache_task_list(user_id, arguments, result, generation)
+
+        monkeypatch.setattr(tasks, "cache_task_list", write_lands_after_query)
+        await self._listed_tasks()
+
+        assert not redis.hashes
+
+    @pytest.mark.asyncio
+    async def test_write_during_backoff_invalidates_when_cache_returns(self, redis, monkeypatch):
+        """A task written while Redis is backing off is not hidden by stale lists."""
+        await self._listed_tasks()
+        assert redis.hashes
+
+        monkeypatch.setattr(task_cache, "_unavailable_until", time.monotonic() + 60)
+        title = f"Written during backoff {uuid4()}"
+        assert (await create_task_tool({"title": title}, MOCK_USER_ID))["success"] is True
+
+        monkeypatch.setattr(task_cache, "_unavailable_until", 0.0)
+        assert title in await self._listed_tasks()
+
+    @pytest.mark.asyncio
+    async def test_failed_invalidation_is_retried(self, redis, monkeypatch):
+        """An invalidation that fails is repeated before cached lists are served again."""
+        await self._listed_tasks()
+
+        redis.fail_invalidations = True
+        title = f"Written while invalidation fails {uuid4()}"
+        assert (await create_task_tool({"title": title}, MOCK_USER_ID))["success"] is True
+
+        redis.fail_invalidations = False
+        monkeypatch.setattr(task_cache, "_unavailable_until", 0.0)
+        assert title in await self._listed_tasks()
 
 
 class TestUpdateTaskStatusTool: